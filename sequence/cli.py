@@ -53,6 +53,7 @@ PLOT_KEYWORDS: dict[str, Any] = {
         "x_of_stack",
         "x_of_shore_at_layer",
         "x_of_shelf_edge_at_layer",
+        "ax",
     ]
 }
 
@@ -305,11 +306,14 @@ def run(ctx: Any, with_citations: bool, dry_run: bool) -> None:
             disable=True if silent else None,
         )
 
-        with suppress(StopIteration), progressbar as bar:
-            while 1:
-                model.run_one_step()
-                model.set_params(params.update(1))
-                bar.update(1)
+        try:
+            with suppress(StopIteration), progressbar as bar:
+                while 1:
+                    model.run_one_step()
+                    model.set_params(params.update(1))
+                    bar.update(1)
+        finally:
+            model.close()
 
         if verbose and not silent:
             total = sum(model.timer.values())
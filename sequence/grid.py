@@ -3,6 +3,9 @@ from __future__ import annotations
 
 import os
 import sys
+from collections.abc import Callable
+from typing import Any
+from typing import TypeVar
 
 import numpy as np
 from landlab import RasterModelGrid
@@ -13,6 +16,8 @@ if sys.version_info >= (3, 11):
 else:
     import tomli as tomllib
 
+T = TypeVar("T")
+
 
 class SequenceModelGrid(RasterModelGrid):
     """Create a Landlab ModelGrid for use with Sequence."""
@@ -47,8 +52,8 @@ class SequenceModelGrid(RasterModelGrid):
         >>> grid.x_of_column
         array([ 0.,  10.,  20.,  30.,  40.])
         """
-        row_col_shape: list[int] = np.atleast_1d(np.asarray(shape, dtype=int))
-        row_col_spacing: list[float] = np.atleast_1d(np.asarray(spacing, dtype=float))
+        row_col_shape = _as_tuple(shape, int)
+        row_col_spacing = _as_tuple(spacing, float)
 
         if (len(row_col_shape) == 1 and len(row_col_spacing) != 1) or (
             len(row_col_shape) != 1 and len(row_col_spacing) != len(row_col_shape)
@@ -60,22 +65,25 @@ class SequenceModelGrid(RasterModelGrid):
 
         if len(row_col_shape) == 1:
             n_rows, n_cols = 1, row_col_shape[0]
+            row_spacing, col_spacing = 1.0, row_col_spacing[0]
         elif len(row_col_shape) == 2:
             n_rows, n_cols = row_col_shape
+            row_spacing, col_spacing = row_col_spacing
         else:
             raise ValueError(
                 f"invalid number of dimensions for grid ({len(row_col_shape)})"
             )
 
-        if len(row_col_shape) == 1:
-            row_spacing, col_spacing = 1.0, row_col_spacing[0]
-        elif len(row_col_shape) == 2:
-            row_spacing, col_spacing = row_col_spacing
-
         super().__init__((n_rows + 2, n_cols), xy_spacing=(col_spacing, row_spacing))
 
-        self.status_at_node[self.nodes_at_top_edge] = self.BC_NODE_IS_CLOSED
-        self.status_at_node[self.nodes_at_bottom_edge] = self.BC_NODE_IS_CLOSED
+        self._x_of_column = self.x_of_node[self.nodes_at_top_edge]
+        self._x_of_column.flags.writeable = False
+        self._y_of_row = self.y_of_node[self.nodes_at_left_edge]
+        self._y_of_row.flags.writeable = False
+
+        self.status_at_node[
+            np.concatenate((self.nodes_at_top_edge, self.nodes_at_bottom_edge))
+        ] = self.BC_NODE_IS_CLOSED
 
         self.at_node["sediment_deposit__thickness"] = self.zeros(at="node")
         self.at_grid["sea_level__elevation"] = 0.0
@@ -83,10 +91,12 @@ class SequenceModelGrid(RasterModelGrid):
         # self.new_field_location("row", size=int(n_rows + 2))
         self.new_field_location("row", size=int(n_rows))
 
+        self._profile_cache: dict[str, tuple[NDArray, NDArray]] = {}
+
     @property
     def x_of_column(self) -> NDArray:
         """X-coordinate for each column of the grid."""
-        return self.x_of_node[self.nodes_at_top_edge]
+        return self._x_of_column.copy()
 
     @property
     def number_of_rows(self) -> int:
@@ -102,7 +112,7 @@ class SequenceModelGrid(RasterModelGrid):
     @property
     def y_of_row(self) -> NDArray:
         """Y-coordinate for each row of the grid."""
-        return self.y_of_node[self.nodes_at_left_edge]
+        return self._y_of_row.copy()
 
     def get_profile(self, name: str) -> NDArray:
         """Return the values of a field along the grid's profile.
@@ -117,8 +127,21 @@ class SequenceModelGrid(RasterModelGrid):
         values : ndarray
             The values of the field located at the middle row of nodes.
         """
-        return self.at_node[name].reshape(self.shape)[1:-1]
-        # return self.at_node[name].reshape(self.shape)[row]
+        values = self.at_node[name]
+        try:
+            cached_values, profile = self._profile_cache[name]
+        except KeyError:
+            pass
+        else:
+            if cached_values is values:
+                return profile
+            # The values were replaced, so stop holding on to the old ones.
+            del self._profile_cache[name]
+
+        profile = values.reshape(self.shape)[1:-1]
+        if values.flags["C_CONTIGUOUS"]:
+            self._profile_cache[name] = (values, profile)
+        return profile
 
     @classmethod
     def from_toml(cls, filepath: os.PathLike[str]) -> SequenceModelGrid:
@@ -181,3 +204,25 @@ class SequenceModelGrid(RasterModelGrid):
             raise KeyError("spacing")
 
         return cls(shape, spacing=spacing)
+
+
+def _as_tuple(value: Any, dtype: Callable[[Any], T]) -> tuple[T, ...]:
+    """Normalize a scalar or sequence of scalars as a tuple.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from sequence.grid import _as_tuple
+    >>> _as_tuple(5, int)
+    (5,)
+    >>> _as_tuple([3, 5], int)
+    (3, 5)
+    >>> _as_tuple(np.array([1.0, 10.0]), float)
+    (1.0, 10.0)
+    """
+    if isinstance(value, np.ndarray):
+        return tuple(dtype(item) for item in value.reshape(-1))
+    elif isinstance(value, (list, tuple)):
+        return tuple(dtype(item) for item in value)
+    else:
+        return (dtype(value),)
@@ -4,19 +4,26 @@ This module contains utilities for reading *Sequence* input data.
 """
 from __future__ import annotations
 
+import bisect
 import inspect
+import itertools
+import operator
 import pathlib
-import warnings
+import sys
 from collections.abc import Callable
 from collections.abc import Iterable
-from collections.abc import Sequence
+from collections.abc import Iterator
 from os import PathLike
 from typing import Any
 from typing import TextIO
 
-import numpy as np
-import tomlkit as toml
-import yaml
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+_MISSING = object()
+_LOADERS: dict[type, dict[str, Callable[[TextIO], list[tuple[float, dict]]]]] = {}
 
 
 def load_config(
@@ -59,6 +66,8 @@ def load_config(
 class TimeVaryingConfig:
     """A configuration dictionary that is able to change with time."""
 
+    __slots__ = ("_times", "_time", "_dicts", "_cumulative", "_current", "_index")
+
     def __init__(self, times: Iterable[float], dicts: Iterable[dict]):
         """Create a time-varying configuration.
 
@@ -81,17 +90,38 @@ class TimeVaryingConfig:
         [(('bar',), 1), (('foo',), 1)]
         """
         self._times = tuple(times)
-        self._dicts = [_flatten_dict(d) for d in dicts]
         self._time = 0
 
-        for d in self._dicts:
-            for key, value in d.items():
-                if isinstance(value, list):
-                    d[key] = tuple(value)
+        keys: dict[tuple[str, ...], tuple[str, ...]] = {}
+        seen: dict[frozenset, dict] = {}
+        flat_dicts = []
+        for d in dicts:
+            if not all(isinstance(key, tuple) for key in d):
+                d = _flatten_dict(d)
+            flat_dict = {
+                keys.setdefault(key, key): tuple(value)
+                if isinstance(value, list)
+                else value
+                for key, value in d.items()
+            }
+            try:
+                flat_dict = seen.setdefault(
+                    frozenset(
+                        (key, _typed_value(value)) for key, value in flat_dict.items()
+                    ),
+                    flat_dict,
+                )
+            except TypeError:
+                pass
+            flat_dicts.append(flat_dict)
+        self._dicts = tuple(flat_dicts)
+
+        self._cumulative = tuple(itertools.accumulate(self._dicts, operator.or_))
 
         self._current = self._dicts[0]
+        self._index = self._bisect_times(self._time)
 
-    def items(self) -> Iterable[tuple[float, dict]]:
+    def items(self) -> Iterable[tuple[tuple[str, ...], Any]]:
         """Return the items of the current configuration."""
         return self._current.items()
 
@@ -112,13 +142,13 @@ class TimeVaryingConfig:
         dict
             The configuration at the time.
         """
-        d = {}
-        for next_dict in self._dicts[: self._bisect_times(time)]:
-            d.update(next_dict)
-        return d
+        return dict(self._cumulative_at(self._bisect_times(time)))
 
     def _bisect_times(self, time: float) -> int:
-        return int(np.searchsorted(self._times, time, side="right"))
+        return bisect.bisect_right(self._times, time)
+
+    def _cumulative_at(self, index: int) -> dict:
+        return self._cumulative[index - 1] if index > 0 else {}
 
     def diff(self, start: float, stop: float) -> dict:
         """Return the difference between two different configurations.
@@ -135,11 +165,10 @@ class TimeVaryingConfig:
         dict
             The key/values that have changed between the two configurations.
         """
-        start_params, stop_params = self(start), self(stop)
-        return {
-            k: stop_params[k]
-            for k, _ in set(stop_params.items()) - set(start_params.items())
-        }
+        return _diff_dicts(
+            self._cumulative_at(self._bisect_times(start)),
+            self._cumulative_at(self._bisect_times(stop)),
+        )
 
     def update(self, inc: int) -> dict:
         """Update the configurations by a time step.
@@ -157,16 +186,15 @@ class TimeVaryingConfig:
         """
         next_time = self._time + inc
 
-        prev = self._bisect_times(self._time)
-        next_ = self._bisect_times(next_time)
+        prev, next_ = self._index, self._bisect_times(next_time)
 
         if next_ > prev:
-            self._current = self(next_time)
-            diff = _expand_dict(self.diff(self._time, next_time))
+            self._current = self._cumulative_at(next_)
+            diff = _expand_dict(_diff_dicts(self._cumulative_at(prev), self._current))
         else:
             diff = {}
 
-        self._time = next_time
+        self._time, self._index = next_time, next_
         return diff
 
     def dump(self, fmt: str = "toml") -> str:
@@ -183,15 +211,21 @@ class TimeVaryingConfig:
             The configuration in the requested format.
         """
         docs = [_expand_dict(self._dicts[0])]
-        for prev, next_ in zip(self._times[:-1], self._times[1:]):
-            docs.append(_expand_dict(self.diff(prev, next_)))
+        for prev, next_ in itertools.pairwise(self._cumulative):
+            docs.append(_expand_dict(_diff_dicts(prev, next_)))
         for time, doc in zip(self._times, docs):
             doc["_time"] = time
 
         if fmt == "toml":
+            import tomlkit as toml
+
             return toml.dumps({"sequence": docs})
         elif fmt == "yaml":
-            return yaml.dump(docs, default_flow_style=False)
+            import yaml
+
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+            return yaml.dump(docs, Dumper=dumper, default_flow_style=False)
         else:
             raise ValueError(f"unrecognized format: {fmt}")
 
@@ -213,7 +247,7 @@ class TimeVaryingConfig:
         dicts = []
         for name in [pathlib.Path(n) for n in names]:
             with open(name) as fp:
-                loader = TimeVaryingConfig.get_loader(name.suffix[1:])
+                loader = cls.get_loader(name.suffix[1:])
                 dicts.extend([p for _, p in loader(fp)])
         if times is None:
             times = list(range(len(dicts)))
@@ -233,10 +267,7 @@ class TimeVaryingConfig:
         filepath = pathlib.Path(name)
         if fmt is None:
             fmt = filepath.suffix[1:]
-        try:
-            loader = getattr(cls, f"load_{fmt}")
-        except AttributeError as error:
-            raise ValueError(f"unrecognized format: {fmt}") from error
+        loader = cls.get_loader(fmt)
 
         with open(name) as fp:
             times_and_params = loader(fp)
@@ -256,7 +287,11 @@ class TimeVaryingConfig:
         list of (float, dict)
             The configurations and their associated times.
         """
-        doc = yaml.safe_load_all(stream)
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+        doc = yaml.load_all(stream, Loader=loader)
         params = []
         for d in doc:
             if isinstance(d, list):
@@ -279,48 +314,16 @@ class TimeVaryingConfig:
         list of (float, dict)
             The configurations and their associated times.
         """
-
-        def _tomlkit_to_popo(d: Any) -> Any:
-            try:
-                result = d.value
-            except AttributeError:
-                result = d
-
-            if isinstance(result, list):
-                result = [_tomlkit_to_popo(x) for x in result]
-            elif isinstance(result, dict):
-                result = {
-                    _tomlkit_to_popo(key): _tomlkit_to_popo(val)
-                    for key, val in result.items()
-                }
-            elif isinstance(result, toml.items.Integer):
-                result = int(result)
-            elif isinstance(result, toml.items.Float):
-                result = float(result)
-            elif isinstance(result, (toml.items.String, str)):
-                result = str(result)
-            elif isinstance(result, (toml.items.Bool, bool)):
-                result = bool(result)
-            else:
-                warnings.warn(
-                    "unexpected type ({!r}) encountered when converting toml to a dict".format(
-                        result.__class__.__name__
-                    ),
-                    stacklevel=2,
-                )
-
-            return result
-
-        doc = toml.parse(stream.read()).pop("sequence")
+        doc = tomllib.loads(stream.read()).pop("sequence")
         if isinstance(doc, list):
-            params = [_tomlkit_to_popo(table) for table in doc]
+            params = doc
         else:
-            params = [_tomlkit_to_popo(doc)]
+            params = [doc]
 
         return [(d.pop("_time", idx), d) for idx, d in enumerate(params)]
 
-    @staticmethod
-    def get_loader(fmt: str) -> Callable[[TextIO], list[tuple[float, dict]]]:
+    @classmethod
+    def get_loader(cls, fmt: str) -> Callable[[TextIO], list[tuple[float, dict]]]:
         """Get a configuration loader for a given format.
 
         Parameters
@@ -339,15 +342,15 @@ class TimeVaryingConfig:
             If a loader for the format can't be found.
         """
         try:
-            return getattr(TimeVaryingConfig, f"load_{fmt}")
-        except AttributeError as error:
-            fmts = set(TimeVaryingConfig.get_supported_formats())
+            return _find_loaders(cls)[fmt]
+        except KeyError as error:
+            fmts = set(cls.get_supported_formats())
             raise ValueError(
                 f"unrecognized format: {fmt!r} (not on of {fmts!r})"
             ) from error
 
-    @staticmethod
-    def get_supported_formats() -> list[str]:
+    @classmethod
+    def get_supported_formats(cls) -> list[str]:
         """Return a list of supported configuration formats.
 
         Returns
@@ -355,11 +358,63 @@ class TimeVaryingConfig:
         list of str
             Names of the supported formats.
         """
-        return [
-            name.split("_", maxsplit=1)[1]
-            for name, _ in inspect.getmembers(TimeVaryingConfig, inspect.isfunction)
+        return list(_find_loaders(cls))
+
+
+def _find_loaders(
+    cls: type[TimeVaryingConfig],
+) -> dict[str, Callable[[TextIO], list[tuple[float, dict]]]]:
+    """Find the configuration loaders of a :class:`~TimeVaryingConfig` class.
+
+    Parameters
+    ----------
+    cls : type
+        A :class:`~TimeVaryingConfig` or one of its subclasses.
+
+    Returns
+    -------
+    dict
+        The loader functions, keyed by the format they load.
+    """
+    try:
+        return _LOADERS[cls]
+    except KeyError:
+        loaders = _LOADERS[cls] = {
+            name.split("_", maxsplit=1)[1]: func
+            for name, func in inspect.getmembers(cls, inspect.isfunction)
             if name.startswith("load_")
-        ]
+        }
+        return loaders
+
+
+def _typed_value(value: Any) -> tuple[type, Any]:
+    """Pair a value with its type so that, for instance, 1 and 1.0 differ.
+
+    Examples
+    --------
+    >>> from sequence.input_reader import _typed_value
+    >>> _typed_value(1) == _typed_value(1.0)
+    False
+    >>> _typed_value((1, True)) == _typed_value((1, 1))
+    False
+    >>> _typed_value((1, "a")) == _typed_value((1, "a"))
+    True
+    """
+    if isinstance(value, tuple):
+        return tuple, tuple(_typed_value(item) for item in value)
+    return type(value), value
+
+
+def _diff_dicts(start: dict, stop: dict) -> dict:
+    """Find the items of one dictionary that differ from another.
+
+    Examples
+    --------
+    >>> from sequence.input_reader import _diff_dicts
+    >>> _diff_dicts({"foo": 0, "bar": 1}, {"foo": 0, "bar": 2, "baz": 3})
+    {'bar': 2, 'baz': 3}
+    """
+    return {k: v for k, v in stop.items() if start.get(k, _MISSING) != v}
 
 
 def _flatten_dict(d: dict, sep: str | None = None) -> dict:
@@ -390,71 +445,82 @@ def _flatten_dict(d: dict, sep: str | None = None) -> dict:
     [('bar', 1), ('foo.baz', 0), ('foo.foobar', 'baz')]
     """
     if sep is None:
-        return dict(_walk_dict(d))
-        # return {keys: value for keys, value in _walk_dict(d)}
+        return dict(_walk_dict_iter(d))
     else:
-        return {sep.join(keys): value for keys, value in _walk_dict(d)}
+        return {sep.join(keys): value for keys, value in _walk_dict_iter(d)}
 
 
-def _add_flattened_item(keys: str, value: Any, base: dict | None = None) -> None:
-    expanded = {} if base is None else base
-    parent, name = keys[:-1], keys[-1]
+def _expand_dict(flat_dict: dict[tuple[str, ...], Any]) -> dict[str, Any]:
+    """Expand a flattened dictionary into a nested dictionary.
 
-    level = expanded
-    for k in parent:
-        if k not in level:
-            level[k] = {}
-        level = level[k]
-    if isinstance(value, tuple):
-        value = list(value)
-    level[name] = value
+    Parameters
+    ----------
+    flat_dict : dict
+        The flattened dictionary, keyed by tuples of keys.
 
+    Returns
+    -------
+    dict
+        The expanded dictionary.
 
-def _expand_dict(flat_dict: dict[str, Any]) -> dict[str, Any]:
+    Examples
+    --------
+    >>> from sequence.input_reader import _expand_dict
+    >>> _expand_dict({("foo", "baz"): 0, ("foo", "foobar"): (1, 2), ("bar",): 1})
+    {'foo': {'baz': 0, 'foobar': [1, 2]}, 'bar': 1}
+    """
     expanded: dict[str, Any] = {}
-    for key, value in flat_dict.items():
-        _add_flattened_item(key, value, base=expanded)
+    for keys, value in flat_dict.items():
+        level = expanded
+        for key in keys[:-1]:
+            level = level.setdefault(key, {})
+        level[keys[-1]] = list(value) if isinstance(value, tuple) else value
     return expanded
 
 
-def _walk_dict(indict: dict[str, Any], prev: Sequence[str] | None = None) -> Iterable:
+def _walk_dict_iter(indict: dict[str, Any]) -> list[tuple[tuple[str, ...], Any]]:
     """Walk the elements of a dictionary.
 
+    Nested dictionaries are walked using an explicit stack rather than
+    through recursion, with items collected in the order they are
+    encountered. Dictionaries that contain no nested dictionaries are
+    handled without the stack.
+
     Parameters
     ----------
     indict : dict
         The dictionary to walk.
-    prev : dict, optional
-        The parent dictionary, if any, that is being walked.
 
-    Yields
-    ------
-    tuple of (*keys*, value)
-        The first element of the tuple is itself a tuple of the keys that have
+    Returns
+    -------
+    list of tuple of (*keys*, value)
+        The first element of each tuple is itself a tuple of the keys that have
         been walked to get to this point, the second the value.
 
     Examples
     --------
-    >>> from sequence.input_reader import _walk_dict
-    >>> sorted(_walk_dict({"foo": 0, "bar": 1}))
-    [(('bar',), 1), (('foo',), 0)]
-    >>> sorted(_walk_dict({"foo": {"baz": 0}, "bar": 1}))
-    [(('bar',), 1), (('foo', 'baz'), 0)]
-    >>> sorted(_walk_dict({"foo": {"bar": {"baz": 0, "foo": "bar"}}, "bar": 1}))
+    >>> from sequence.input_reader import _walk_dict_iter
+    >>> _walk_dict_iter({"foo": 0, "bar": 1})
+    [(('foo',), 0), (('bar',), 1)]
+    >>> _walk_dict_iter({"foo": {"baz": 0}, "bar": 1})
+    [(('foo', 'baz'), 0), (('bar',), 1)]
+    >>> sorted(_walk_dict_iter({"foo": {"bar": {"baz": 0, "foo": "bar"}}, "bar": 1}))
     [(('bar',), 1), (('foo', 'bar', 'baz'), 0), (('foo', 'bar', 'foo'), 'bar')]
     """
-    if prev is not None:
-        prev_dicts = list(prev)
-    else:
-        prev_dicts = []
-
-    if isinstance(indict, dict):
-        for key, value in indict.items():
+    if not any(isinstance(value, dict) for value in indict.values()):
+        return [((key,), value) for key, value in indict.items()]
+
+    items: list[tuple[tuple[str, ...], Any]] = []
+    stack: list[tuple[tuple[str, ...], Iterator[tuple[str, Any]]]] = [
+        ((), iter(indict.items()))
+    ]
+    while stack:
+        prev, level = stack[-1]
+        for key, value in level:
             if isinstance(value, dict):
-                yield from _walk_dict(value, prev_dicts + [key])
-            elif isinstance(value, (list, tuple)):
-                yield tuple(prev_dicts + [key]), value
-            else:
-                yield tuple(prev_dicts + [key]), value
-    else:
-        yield indict
+                stack.append((prev + (key,), iter(value.items())))
+                break
+            items.append((prev + (key,), value))
+        else:
+            stack.pop()
+    return items
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
 import sys
 from collections.abc import Generator
@@ -33,17 +34,20 @@ class LoggingHandler(logging.Handler):
         record : LogRecord
             The log to print.
         """
-        level_msg = click.style(
-            f"[{record.levelname}]", **LOG_LEVEL_STYLES[record.levelname]
+        lines = record.getMessage().splitlines() or [""]
+
+        styled = [f"{_styled_level(record.levelname)} {lines[0]}"]
+        styled.extend(
+            click.style(f"+ {line}", **MULTILINE_STYLES) for line in lines[1:]
         )
-        lines = record.getMessage().splitlines()
-        if len(lines) == 0:
-            lines = [""]
-        print(f"{level_msg} {lines[0]}", file=sys.stderr)
-
-        if len(lines) > 1:
-            for line in lines[1:]:
-                print(click.style(f"+ {line}", **MULTILINE_STYLES), file=sys.stderr)
+
+        sys.stderr.write("\n".join(styled) + "\n")
+
+
+@functools.cache
+def _styled_level(levelname: str) -> str:
+    """Style the tag that starts a log message of a given level."""
+    return click.style(f"[{levelname}]", **LOG_LEVEL_STYLES[levelname])
 
 
 @contextlib.contextmanager
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import contextlib
+import functools
+import math
 import os
 import warnings
 from collections import defaultdict
@@ -9,9 +11,11 @@ from collections.abc import Iterable
 from collections.abc import Sequence
 from os import PathLike
 from typing import Any
+from typing import NamedTuple
 
 import netCDF4 as nc
 import numpy as np
+from numpy.typing import ArrayLike
 from numpy.typing import NDArray
 
 from sequence.grid import SequenceModelGrid
@@ -29,8 +33,15 @@ _NUMPY_TO_NETCDF_TYPE = {
     "uint64": "u8",
     "bool": "i1",
 }
+_CHUNK_NBYTES = 1 << 16
+_DEFAULT_FILTERS = {"zlib": True, "complevel": 1, "shuffle": True, "fletcher32": False}
+_KIND_AND_SIZE_TO_NETCDF_TYPE = {
+    (np.dtype(name).kind, np.dtype(name).itemsize): netcdf_type
+    for name, netcdf_type in _NUMPY_TO_NETCDF_TYPE.items()
+}
 
 
+@functools.cache
 def _netcdf_var_name(name: str, at: str) -> str:
     """Get the name a field will be stored as in a netCDF file."""
     return f"at_{at}:{name}"
@@ -38,7 +49,38 @@ def _netcdf_var_name(name: str, at: str) -> str:
 
 def _netcdf_type(arr: NDArray) -> str:
     """Get the netCDF type string for a numpy array."""
-    return _NUMPY_TO_NETCDF_TYPE[str(arr.dtype)]
+    return _KIND_AND_SIZE_TO_NETCDF_TYPE[arr.dtype.kind, arr.dtype.itemsize]
+
+
+def _create_variable(
+    root: Any,
+    name: str,
+    datatype: str,
+    dimensions: Sequence[str],
+    chunksizes: Sequence[int] | None = None,
+    filters: dict[str, Any] | None = None,
+) -> Any:
+    """Create a netCDF variable that is written without masking or scaling."""
+    if filters is None:
+        filters = _DEFAULT_FILTERS
+    variable = root.createVariable(
+        name, datatype, dimensions, chunksizes=chunksizes, **filters
+    )
+    variable.set_auto_maskandscale(False)
+    variable.set_auto_chartostring(False)
+    return variable
+
+
+def _chunksizes(root: Any, datatype: str, dimensions: Sequence[str]) -> tuple[int, ...]:
+    """Chunk sizes that hold whole slices along a variable's first dimension.
+
+    Slices are grouped along the first (unlimited) dimension so that a chunk
+    is about ``_CHUNK_NBYTES`` bytes, which keeps appends from creating many
+    tiny chunks, but a chunk always holds at least one slice.
+    """
+    shape = tuple(max(len(root.dimensions[dim]), 1) for dim in dimensions[1:])
+    slice_nbytes = np.dtype(datatype).itemsize * math.prod(shape)
+    return (max(_CHUNK_NBYTES // slice_nbytes, 1),) + shape
 
 
 def _create_grid_dimension(
@@ -83,18 +125,16 @@ def _create_grid_coordinates(
     grid: SequenceModelGrid,
     at: str = "node",
     ids: slice | Iterable[int] | None = None,
+    filters: dict[str, Any] | None = None,
 ) -> Any:
     """Create x and y coordinates for a field location."""
     _create_grid_dimension(root, grid, at=at, ids=ids)
 
     if at != "grid":
-        root.createVariable(f"x_of_{at}", "f8", (at,))
-        root.createVariable(f"y_of_{at}", "f8", (at,))
-
         for coord in ("x", "y"):
             name = f"{coord}_of_{at}"
             if name not in root.variables:
-                root.createVariable(name, "f8", (at,))
+                _create_variable(root, name, "f8", (at,), filters=filters)
 
     return root
 
@@ -121,9 +161,9 @@ def _set_grid_coordinates(
         coords = getattr(grid, f"x_of_{at}")
         root.variables[f"x_of_{at}"][:] = coords[ids]
     else:
-        coords = getattr(grid, f"xy_of_{at}")
-        root.variables[f"x_of_{at}"][:] = coords[ids, 0]
-        root.variables[f"y_of_{at}"][:] = coords[ids, 1]
+        x, y = getattr(grid, f"xy_of_{at}")[ids].T
+        root.variables[f"x_of_{at}"][:] = np.ascontiguousarray(x)
+        root.variables[f"y_of_{at}"][:] = np.ascontiguousarray(y)
 
 
 def _create_field(
@@ -131,8 +171,15 @@ def _create_field(
     grid: SequenceModelGrid,
     at: str = "node",
     names: Iterable[str] | None = None,
-) -> None:
-    """Create variables at a field location(s)."""
+    filters: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Create variables at a field location(s).
+
+    Returns
+    -------
+    dict
+        The netCDF variables, keyed by field name.
+    """
     if names is None:
         names = grid[at]
 
@@ -140,20 +187,35 @@ def _create_field(
     if "time" in root.dimensions:
         dimensions = ["time"] + dimensions
 
+    variables = {}
     for name in names:
         netcdf_name = _netcdf_var_name(name, at)
-        if netcdf_name not in root.variables:
-            root.createVariable(netcdf_name, _netcdf_type(grid[at][name]), dimensions)
+        try:
+            variables[name] = root.variables[netcdf_name]
+        except KeyError:
+            datatype = _netcdf_type(grid[at][name])
+            variables[name] = _create_variable(
+                root,
+                netcdf_name,
+                datatype,
+                dimensions,
+                chunksizes=(
+                    _chunksizes(root, datatype, dimensions)
+                    if "time" in dimensions
+                    else None
+                ),
+                filters=filters,
+            )
+    return variables
 
 
-def _set_field(
-    root: Any,
+def _get_field_names(
     grid: SequenceModelGrid,
     at: str = "node",
-    ids: slice | Iterable[int] | None = None,
     names: str | Iterable[str] | None = None,
-) -> None:
-    """Set values for variables at a field location(s)."""
+    stacklevel: int = 3,
+) -> set[str]:
+    """Get the names of the fields at a location that are to be written."""
     if isinstance(names, str):
         names = [names]
     names = set(names or grid[at])
@@ -161,7 +223,7 @@ def _set_field(
     if missing := names - set(grid[at]):
         warnings.warn(
             f"missing field{'(s)' if len(missing) > 1 else ''} ({', '.join(missing)})",
-            stacklevel=2,
+            stacklevel=stacklevel,
         )
         names = names & set(grid[at])
 
@@ -171,114 +233,136 @@ def _set_field(
         with contextlib.suppress(KeyError):
             names.remove("x_of_shore")
 
-    _create_field(root, grid, at=at, names=names)
+    return names
 
-    if "time" in root.dimensions:
-        n_times = len(root.dimensions["time"])
-        for name in names:
-            if grid[at][name].ndim > 0:
-                values = grid[at][name][ids]
-            else:
-                values = grid[at][name]
-            root.variables[_netcdf_var_name(name, at)][n_times - 1, :] = values
-    else:
-        for name in names:
-            root.variables[_netcdf_var_name(name, at)][:] = grid[at][name][ids]
+
+def _as_netcdf_values(values: ArrayLike) -> ArrayLike:
+    """Reinterpret boolean values as the int8 values that netCDF stores."""
+    if isinstance(values, np.ndarray) and values.dtype == np.bool_:
+        return values.view(np.int8)
+    return values
 
 
 def _create_layers(
-    root: Any, grid: SequenceModelGrid, names: Iterable[str] | None = None
-) -> None:
-    """Create variables at grid layers."""
+    root: Any,
+    grid: SequenceModelGrid,
+    names: Iterable[str] | None = None,
+    filters: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Create variables at grid layers.
+
+    Returns
+    -------
+    dict
+        The netCDF variables, keyed by layer name.
+    """
     if names is None:
         names = []
+
+    dimensions = ("layer", "row", "column")
+
+    variables = {}
     for name in names:
         netcdf_name = _netcdf_var_name(name, "layer")
-        if netcdf_name not in root.variables:
-            root.createVariable(
+        try:
+            variables[name] = root.variables[netcdf_name]
+        except KeyError:
+            datatype = _netcdf_type(grid.event_layers[name])
+            variables[name] = _create_variable(
+                root,
                 netcdf_name,
-                _netcdf_type(grid.event_layers[name]),
-                ("layer", "row", "column"),
+                datatype,
+                dimensions,
+                chunksizes=_chunksizes(root, datatype, dimensions),
+                filters=filters,
             )
 
     netcdf_name = _netcdf_var_name("thickness", "layer")
-    if netcdf_name not in root.variables:
-        root.createVariable(netcdf_name, "f8", ("layer", "row", "column"))
+    try:
+        variables["thickness"] = root.variables[netcdf_name]
+    except KeyError:
+        variables["thickness"] = _create_variable(
+            root,
+            netcdf_name,
+            "f8",
+            dimensions,
+            chunksizes=_chunksizes(root, "f8", dimensions),
+            filters=filters,
+        )
 
+    return variables
 
-def _set_layers(
-    root: Any,
+
+def _write_layers(
     grid: SequenceModelGrid,
-    names: Iterable[str] | None = None,
+    variables: dict[str, Any],
     ids: slice | Iterable[int] | None = None,
 ) -> None:
-    """Set values for variables at a grid layers."""
-    if isinstance(names, str):
-        names = [names]
-    names = names or grid.event_layers.tracking
+    """Write the values of grid layers to their netCDF variables."""
+    _write_layer_values(variables, _get_layer_values(grid, variables, ids=ids))
 
-    if "layer" not in root.dimensions:
-        root.createDimension("layer", None)
 
-    _create_layers(root, grid, names=names)
+def _get_layer_values(
+    grid: SequenceModelGrid,
+    names: Iterable[str],
+    ids: slice | Iterable[int] | None = None,
+    copy: bool = False,
+) -> dict[str, NDArray]:
+    """Get the values of grid layers, shaped as (layer, row, column)."""
+    if ids is None:
+        ids = slice(None)
+    elif not isinstance(ids, slice):
+        ids = np.asarray(ids, dtype=int)
+    shape = (-1, grid.shape[0] - 2, grid.shape[1] - 2)
 
-    n_layers = grid.event_layers.number_of_layers
+    layer_values = {}
     for name in names:
-        layers = grid.event_layers[name][:, ids].reshape(
-            (-1, grid.shape[0] - 2, grid.shape[1] - 2)
-        )
-        root.variables[_netcdf_var_name(name, "layer")][:n_layers, :, :] = layers
+        if name == "thickness":
+            values = grid.event_layers.dz[:, ids]
+        else:
+            values = grid.event_layers[name][:, ids]
+        if copy:
+            values = np.array(values, order="C", copy=True)
+        else:
+            values = np.ascontiguousarray(values)
+        layer_values[name] = values.reshape(shape)
+    return layer_values
 
-    dz = grid.event_layers.dz[:, ids].reshape(
-        (-1, grid.shape[0] - 2, grid.shape[1] - 2)
-    )
-    root.variables[_netcdf_var_name("thickness", "layer")][:n_layers, :, :] = dz
 
+def _write_layer_values(variables: dict[str, Any], values: dict[str, NDArray]) -> None:
+    """Write the values of grid layers to their netCDF variables."""
+    for name, variable in variables.items():
+        variable[: len(values[name]), :, :] = _as_netcdf_values(values[name])
 
-def to_netcdf(
+
+class WritePlan(NamedTuple):
+    """The fields, and the elements of those fields, to write to a file.
+
+    Attributes
+    ----------
+    names : dict
+        Names of the fields to write, keyed by grid location.
+    ids : dict
+        Ids of the elements to write, keyed by grid location.
+    with_layers : bool
+        Indicate if the grid's layers are to be written.
+    """
+
+    names: dict[str, tuple[str, ...]]
+    ids: dict[str, slice | NDArray[np.intp]]
+    with_layers: bool = True
+
+
+def _make_write_plan(
     grid: SequenceModelGrid,
-    filepath: str | PathLike[str],
-    mode: str = "w",
-    format: str = "NETCDF4",
-    time: float = 0.0,
     at: str | Sequence[str] | None = None,
     ids: dict[str, NDArray[np.integer]] | int | Iterable[int] | slice | None = None,
     names: None | (dict[str, Iterable[str] | None] | str | Iterable[str]) = None,
     with_layers: bool = True,
-) -> None:
-    """Write a grid and fields to a netCDF file.
-
-    Parameters
-    ----------
-    grid: grid_like
-        A landlab grid.
-    filepath: str
-        File to which to save the grid.
-    mode: {'w', 'a'}, optional
-        Write ('w') or append ('a') mode. If mode='w', any existing
-        file at this location will be overwritten. If mode="a",
-        existing variables will be appended as a new time slice.
-    format: {'NETCDF4', 'NETCDF4_CLASSIC', 'NETCDF3_64BIT', 'NETCDF3_CLASSIC'}, optional
-        File format for the resulting netCDF file.
-    time: float, optional
-        Time to use when adding data. This will be appended to the time
-        variable.
-    at: str or iterable or str, optional
-        Field location(s) on the grid for fields to write. Locations can
-        be 'node', 'link', 'patch', 'corner', 'face', 'patch'. The default
-        is to write variables from all field locations.
-    ids: array_like of int, optional
-        Indices of elements to write.
-    names: iterable or str, optional
-        Names of fields to write to the netCDF file.
-    with_layers : bool, optional
-        Indicate if the NetCDF file should contain the grid's layers.
-    """
-    if with_layers and format != "NETCDF4":
-        raise ValueError("Grid layers are only available with the NETCDF4 format.")
+) -> WritePlan:
+    """Find the fields to write to a file, and the elements to write them at."""
     if at is None:
         at = ["node", "link", "face", "cell", "grid"]
-
     if isinstance(at, str):
         at = [at]
     if isinstance(names, str):
@@ -310,7 +394,7 @@ def to_netcdf(
         names_dict["grid"].remove("x_of_shelf_edge")
     names_dict["row"] = ["x_of_shore", "x_of_shelf_edge"]
 
-    ids_dict: dict[str, slice | Iterable[int]] = defaultdict(lambda: slice(None))
+    ids_dict: dict[str, slice | Iterable[int]] = {}
     if not isinstance(ids, dict):
         for loc in at:
             ids_dict[loc] = ids
@@ -321,33 +405,359 @@ def to_netcdf(
             else:
                 ids_dict[loc] = ids_
 
-    if not os.path.isfile(filepath):
-        mode = "w"
-    root = nc.Dataset(filepath, mode, format=format)
+    field_names = {}
+    for loc in [*at, "row"]:
+        field_names[loc] = tuple(
+            sorted(_get_field_names(grid, at=loc, names=names_dict[loc], stacklevel=4))
+        )
+
+    return WritePlan(
+        names=field_names,
+        ids={
+            loc: _as_ids(ids_dict.get(loc, slice(None)))
+            for loc in {*field_names, "row", "column", "cell"}
+        },
+        with_layers=with_layers,
+    )
+
+
+def _as_ids(ids: slice | Iterable[int]) -> slice | NDArray[np.intp]:
+    """Convert element ids to a slice or a contiguous array of indices.
+
+    Examples
+    --------
+    >>> from sequence.netcdf import _as_ids
+    >>> _as_ids([1, 2])
+    array([1, 2])
+    >>> _as_ids(slice(None))
+    slice(None, None, None)
+    """
+    if isinstance(ids, slice):
+        return ids
+    return np.ascontiguousarray(ids, dtype=np.intp)
 
-    if mode == "w":
+
+def _create_netcdf(
+    root: Any,
+    grid: SequenceModelGrid,
+    plan: WritePlan,
+    filters: dict[str, Any] | None = None,
+) -> tuple[dict[str, dict[str, Any]], dict[str, Any]]:
+    """Create the variables of a netCDF file, if they don't already exist.
+
+    Returns
+    -------
+    tuple of dict
+        The netCDF variables for fields, keyed by location and then field
+        name, and the netCDF variables for layers, keyed by layer name.
+    """
+    is_new = "time" not in root.dimensions
+    locations = ["row", "column"] + [
+        loc for loc in plan.names if loc not in ("row", "column")
+    ]
+
+    if is_new:
         root.createDimension("time", None)
-        root.createVariable("time", "f8", ("time",))
+        _create_variable(root, "time", "f8", ("time",), filters=filters)
+        for loc in locations:
+            _create_grid_coordinates(
+                root, grid, at=loc, ids=plan.ids[loc], filters=filters
+            )
 
-        _set_grid_coordinates(root, grid, at="row", ids=ids_dict["row"])
-        _set_grid_coordinates(root, grid, at="column", ids=ids_dict["column"])
-        for loc in at:
-            _set_grid_coordinates(root, grid, at=loc, ids=ids_dict[loc])
+    variables = {
+        loc: _create_field(root, grid, at=loc, names=names, filters=filters)
+        for loc, names in plan.names.items()
+    }
+    layer_variables = {}
+    if plan.with_layers:
+        if "layer" not in root.dimensions:
+            root.createDimension("layer", None)
+        layer_variables = _create_layers(
+            root, grid, names=grid.event_layers.tracking, filters=filters
+        )
+
+    if is_new:
+        for loc in locations:
+            _set_grid_coordinates(root, grid, at=loc, ids=plan.ids[loc])
+
+    return variables, layer_variables
+
+
+def _time_slice(
+    grid: SequenceModelGrid, plan: WritePlan
+) -> dict[str, dict[str, NDArray]]:
+    """Get the current values of fields as a single time slice.
+
+    Returns
+    -------
+    dict
+        Field values, with a leading time dimension of length one, keyed by
+        location and then field name.
+    """
+    values: dict[str, dict[str, NDArray]] = {}
+    for loc, names in plan.names.items():
+        values[loc] = {}
+        for name in names:
+            field = grid[loc][name]
+            if field.ndim > 0:
+                field = field[plan.ids[loc]]
+            values[loc][name] = field[np.newaxis, ...]
+    return values
+
+
+def _empty_time_slices(
+    grid: SequenceModelGrid, plan: WritePlan, n_times: int
+) -> dict[str, dict[str, NDArray]]:
+    """Allocate buffers to hold time slices of field values.
+
+    Returns
+    -------
+    dict
+        Uninitialized arrays, with a leading time dimension of length
+        *n_times*, keyed by location and then field name.
+    """
+    return {
+        loc: {
+            name: np.empty((n_times,) + field.shape[1:], dtype=field.dtype)
+            for name, field in fields.items()
+        }
+        for loc, fields in _time_slice(grid, plan).items()
+    }
+
+
+def _copy_time_slice(
+    grid: SequenceModelGrid,
+    plan: WritePlan,
+    out: dict[str, dict[str, NDArray]],
+    index: int,
+) -> None:
+    """Copy the current values of fields into a buffer of time slices."""
+    for loc, buffers in out.items():
+        ids = plan.ids[loc]
+        for name, buffer in buffers.items():
+            field = grid[loc][name]
+            if field.ndim == 0:
+                buffer[index] = field
+            elif isinstance(ids, slice):
+                np.copyto(buffer[index, ...], field[ids])
+            else:
+                np.take(field, ids, axis=0, out=buffer[index, ...])
+
+
+def _write_time_slices(
+    root: Any,
+    variables: dict[str, dict[str, Any]],
+    times: Sequence[float],
+    values: dict[str, dict[str, NDArray]],
+    start: int | None = None,
+) -> None:
+    """Append time slices of field values to their netCDF variables.
+
+    The field *values* have a leading time dimension, of which the first
+    ``len(times)`` elements are written. If the number of time slices
+    already in the file, *start*, is not provided, it's read from the
+    file's time dimension.
+    """
+    if start is None:
+        start = len(root.dimensions["time"])
+    n_times = len(times)
+
+    root.variables["time"][start : start + n_times] = times
+    for loc, loc_variables in variables.items():
+        for name, variable in loc_variables.items():
+            variable[start : start + n_times, ...] = _as_netcdf_values(
+                values[loc][name][:n_times]
+            )
+
+
+def _append_time_slices(
+    root: Any,
+    grid: SequenceModelGrid,
+    plan: WritePlan,
+    times: Sequence[float],
+    values: dict[str, dict[str, NDArray]],
+    filters: dict[str, Any] | None = None,
+) -> None:
+    """Append time slices of field values, and the grid's layers, to a file."""
+    variables, layer_variables = _create_netcdf(root, grid, plan, filters=filters)
+    _write_time_slices(root, variables, times, values)
+    _write_layers(grid, layer_variables, ids=plan.ids["cell"])
+
+
+def open_netcdf(
+    filepath: str | PathLike[str],
+    mode: str = "w",
+    format: str = "NETCDF4",
+    diskless: bool = False,
+) -> nc.Dataset:
+    """Open a netCDF file to write a grid to.
+
+    Parameters
+    ----------
+    filepath: str
+        File to which to save the grid.
+    mode: {'w', 'a'}, optional
+        Write ('w') or append ('a') mode. If the file doesn't exist, it
+        is created regardless of the mode.
+    format: {'NETCDF4', 'NETCDF4_CLASSIC', 'NETCDF3_64BIT', 'NETCDF3_CLASSIC'}, optional
+        File format for the resulting netCDF file.
+    diskless : bool, optional
+        Keep the file in memory and only write it to disk when it's closed.
+
+    Returns
+    -------
+    netCDF4.Dataset
+        The open netCDF file, ready to have time slices appended to it
+        with :func:`append_netcdf`.
+    """
+    if mode != "w" and not os.path.isfile(filepath):
+        mode = "w"
+    root = nc.Dataset(
+        filepath, mode, format=format, diskless=diskless, persist=diskless
+    )
+    root.set_auto_maskandscale(False)
+    root.set_auto_chartostring(False)
+    return root
+
+
+def append_netcdf(
+    root: nc.Dataset,
+    grid: SequenceModelGrid,
+    time: float = 0.0,
+    at: str | Sequence[str] | None = None,
+    ids: dict[str, NDArray[np.integer]] | int | Iterable[int] | slice | None = None,
+    names: None | (dict[str, Iterable[str] | None] | str | Iterable[str]) = None,
+    with_layers: bool = True,
+    zlib: bool = True,
+    complevel: int = 1,
+    shuffle: bool = True,
+    fletcher32: bool = False,
+) -> None:
+    """Append a time slice of a grid and its fields to an open netCDF file.
+
+    The first time slice appended to a file also creates the file's
+    dimensions, coordinates, and variables. Unlike :func:`to_netcdf`,
+    the file is left open so that it can be appended to repeatedly
+    without paying the cost of opening it each time.
+
+    Parameters
+    ----------
+    root: netCDF4.Dataset
+        A netCDF file, opened with :func:`open_netcdf`.
+    grid: grid_like
+        A landlab grid.
+    time: float, optional
+        Time to use when adding data. This will be appended to the time
+        variable.
+    at: str or iterable or str, optional
+        Field location(s) on the grid for fields to write.
+    ids: array_like of int, optional
+        Indices of elements to write.
+    names: iterable or str, optional
+        Names of fields to write to the netCDF file.
+    with_layers : bool, optional
+        Indicate if the NetCDF file should contain the grid's layers.
+    zlib : bool, optional
+        Compress variables with deflate. Compression is only available
+        with the NETCDF4 formats and is ignored otherwise.
+    complevel : int, optional
+        Deflate compression level, from 1 (fastest) to 9 (smallest).
+    shuffle : bool, optional
+        Shuffle the bytes of values before compressing them, which
+        usually improves compression of floating-point data.
+    fletcher32 : bool, optional
+        Add a Fletcher32 checksum to each chunk.
+    """
+    if with_layers and root.data_model != "NETCDF4":
+        raise ValueError("Grid layers are only available with the NETCDF4 format.")
 
-    n_times = len(root.dimensions["time"])
-    root.variables["time"][n_times] = time
+    plan = _make_write_plan(grid, at=at, ids=ids, names=names, with_layers=with_layers)
 
-    for loc in at:
-        _set_field(root, grid, at=loc, ids=ids_dict[loc], names=names_dict[loc])
-    _set_field(
+    _append_time_slices(
         root,
         grid,
-        at="row",
-        ids=ids_dict["row"],
-        names=["x_of_shore", "x_of_shelf_edge"],
+        plan,
+        [time],
+        _time_slice(grid, plan),
+        filters={
+            "zlib": zlib,
+            "complevel": complevel,
+            "shuffle": shuffle,
+            "fletcher32": fletcher32,
+        },
     )
 
-    if with_layers:
-        _set_layers(root, grid, names=None, ids=ids_dict.get("cell", None))
 
+def to_netcdf(
+    grid: SequenceModelGrid,
+    filepath: str | PathLike[str],
+    mode: str = "w",
+    format: str = "NETCDF4",
+    time: float = 0.0,
+    at: str | Sequence[str] | None = None,
+    ids: dict[str, NDArray[np.integer]] | int | Iterable[int] | slice | None = None,
+    names: None | (dict[str, Iterable[str] | None] | str | Iterable[str]) = None,
+    with_layers: bool = True,
+    zlib: bool = True,
+    complevel: int = 1,
+    shuffle: bool = True,
+    fletcher32: bool = False,
+) -> None:
+    """Write a grid and fields to a netCDF file.
+
+    Parameters
+    ----------
+    grid: grid_like
+        A landlab grid.
+    filepath: str
+        File to which to save the grid.
+    mode: {'w', 'a'}, optional
+        Write ('w') or append ('a') mode. If mode='w', any existing
+        file at this location will be overwritten. If mode="a",
+        existing variables will be appended as a new time slice.
+    format: {'NETCDF4', 'NETCDF4_CLASSIC', 'NETCDF3_64BIT', 'NETCDF3_CLASSIC'}, optional
+        File format for the resulting netCDF file.
+    time: float, optional
+        Time to use when adding data. This will be appended to the time
+        variable.
+    at: str or iterable or str, optional
+        Field location(s) on the grid for fields to write. Locations can
+        be 'node', 'link', 'patch', 'corner', 'face', 'patch'. The default
+        is to write variables from all field locations.
+    ids: array_like of int, optional
+        Indices of elements to write.
+    names: iterable or str, optional
+        Names of fields to write to the netCDF file.
+    with_layers : bool, optional
+        Indicate if the NetCDF file should contain the grid's layers.
+    zlib : bool, optional
+        Compress variables with deflate. Compression is only available
+        with the NETCDF4 formats and is ignored otherwise.
+    complevel : int, optional
+        Deflate compression level, from 1 (fastest) to 9 (smallest).
+    shuffle : bool, optional
+        Shuffle the bytes of values before compressing them, which
+        usually improves compression of floating-point data.
+    fletcher32 : bool, optional
+        Add a Fletcher32 checksum to each chunk.
+    """
+    if with_layers and format != "NETCDF4":
+        raise ValueError("Grid layers are only available with the NETCDF4 format.")
+
+    plan = _make_write_plan(grid, at=at, ids=ids, names=names, with_layers=with_layers)
+
+    root = open_netcdf(filepath, mode=mode, format=format)
+    _append_time_slices(
+        root,
+        grid,
+        plan,
+        [time],
+        _time_slice(grid, plan),
+        filters={
+            "zlib": zlib,
+            "complevel": complevel,
+            "shuffle": shuffle,
+            "fletcher32": fletcher32,
+        },
+    )
     root.close()
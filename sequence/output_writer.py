@@ -4,13 +4,27 @@ from __future__ import annotations
 import errno
 import os
 from collections.abc import Iterable
+from collections.abc import Sequence
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from os import PathLike
+from typing import Any
 
+import netCDF4 as nc
 import numpy as np
 from landlab import Component
+from numpy.typing import NDArray
 
 from sequence.grid import SequenceModelGrid
-from sequence.netcdf import to_netcdf
+from sequence.netcdf import _copy_time_slice
+from sequence.netcdf import _create_netcdf
+from sequence.netcdf import _empty_time_slices
+from sequence.netcdf import _get_layer_values
+from sequence.netcdf import _make_write_plan
+from sequence.netcdf import _write_layer_values
+from sequence.netcdf import _write_time_slices
+from sequence.netcdf import open_netcdf
+from sequence.netcdf import WritePlan
 
 
 class OutputWriter(Component):
@@ -24,6 +38,11 @@ class OutputWriter(Component):
         fields: Iterable[str] | None = None,
         clobber: bool = False,
         rows: Iterable[str] | None = None,
+        buffer_size: int = 1,
+        in_memory: bool = False,
+        format: str = "NETCDF4",
+        with_layers: bool = True,
+        background: bool = False,
     ):
         """Create an output-file writer.
 
@@ -42,9 +61,59 @@ class OutputWriter(Component):
             it, otherwise raise an exception.
         rows : iterable of int
             The rows of the grid to include in the file.
+        buffer_size : int, optional
+            The number of time slices to hold in memory before writing
+            them, all at once, to the output file.
+        in_memory : bool, optional
+            If `True`, keep the output file in memory and only write it to
+            disk when the writer is closed. This avoids file-system
+            overhead on every write but the file can't be read until the
+            simulation is done.
+        format : str, optional
+            File format of the output file (one of 'NETCDF4',
+            'NETCDF4_CLASSIC', 'NETCDF3_64BIT_OFFSET' or 'NETCDF3_CLASSIC').
+            The NETCDF3 formats have less per-write overhead than the
+            HDF5-based NETCDF4 formats, which can make them faster for
+            small grids, but they can't be compressed or store 64-bit or
+            unsigned integer fields.
+        with_layers : bool, optional
+            Indicate if the output file should contain the grid's layers.
+            Layers are only available with the NETCDF4 format.
+        background : bool, optional
+            If `True`, write buffered time slices to the output file from a
+            background thread. While one buffer is being written, time
+            slices are collected into a second buffer, so that writing
+            overlaps with the simulation rather than stalling it. Errors
+            from a background write are raised by a later write, so call
+            :meth:`close` once done to write the last buffer and raise any
+            such error.
         """
+        self._buffered_times: list[float] = []
+        self._buffered_values: dict[str, dict[str, NDArray]] = {}
+        self._spare_values: dict[str, dict[str, NDArray]] = {}
+        self._root: nc.Dataset | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: Future | None = None
+        self._plan: WritePlan | None = None
+        self._variables: dict[str, dict[str, Any]] | None = None
+        self._layer_variables: dict[str, Any] = {}
+        self._layer_values: dict[str, NDArray] = {}
+        self._n_times = 0
+        self._fields: tuple[str, ...] = ()
+        self._countdown = 0
+        self._created = False
+
         if fields is None:
             fields = []
+        if buffer_size < 1:
+            raise ValueError(f"buffer size must be positive ({buffer_size})")
+        self._buffer_size = buffer_size
+        self._in_memory = in_memory
+        if with_layers and format != "NETCDF4":
+            raise ValueError("Grid layers are only available with the NETCDF4 format.")
+        self._format = format
+        self._with_layers = with_layers
+        self._background = background
 
         super().__init__(grid)
 
@@ -54,12 +123,12 @@ class OutputWriter(Component):
         self.filepath = filepath
 
         if rows is not None:
-            self._rows = np.asarray(rows) - 1
+            self._rows = np.ascontiguousarray(rows, dtype=np.intp) - 1
         else:
             self._rows = np.arange(grid.shape[0] - 2)
+        self._cols = np.arange(grid.shape[1] - 2)
 
         self._time = 0.0
-        self._step_count = 0
 
     def run_one_step(self, dt: float | None = None) -> None:
         """Update the writer by a time step.
@@ -70,20 +139,171 @@ class OutputWriter(Component):
             The time step to update the component by.
         """
         dt = 1.0 if dt is None else float(dt)
-        if self._step_count % self.interval == 0:
-            to_netcdf(
-                self.grid,
+        if self._countdown == 0:
+            self._buffer_time_slice()
+            self._countdown = self._interval - 1
+        else:
+            self._countdown -= 1
+        self._time += dt
+
+    def flush(self) -> None:
+        """Write any buffered time slices to the output file."""
+        if not self._buffered_times:
+            return
+        plan = self._plan
+        assert plan is not None
+
+        if self._root is None:
+            # Once the file exists, append to it (rather than truncating it)
+            # and do so on disk, since netCDF can't append to a diskless
+            # NETCDF4 file.
+            self._root = open_netcdf(
                 self.filepath,
-                mode="a",
-                time=self._time,
+                mode="a" if self._created else "w",
+                format=self._format,
+                diskless=self._in_memory and not self._created,
+            )
+            self._created = True
+            self._variables = None
+        if self._variables is None:
+            self._variables, self._layer_variables = _create_netcdf(
+                self._root, self.grid, plan
+            )
+            self._n_times = len(self._root.dimensions["time"])
+        root, variables = self._root, self._variables
+
+        times = list(self._buffered_times)
+        # Drop the buffered times even if the write fails so that a failed
+        # write isn't retried (and raised again) on the next flush.
+        layer_values, self._layer_values = self._layer_values, {}
+        try:
+            if self._background:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1)
+                pending, self._pending = self._pending, self._executor.submit(
+                    self._write,
+                    root,
+                    variables,
+                    self._layer_variables,
+                    self._n_times,
+                    times,
+                    self._buffered_values,
+                    layer_values,
+                )
+                self._n_times += len(times)
+                # Swap buffers before waiting on the previous write so that,
+                # even if that write failed, the next time slices are never
+                # copied into the buffer the new write is reading.
+                self._buffered_values, self._spare_values = (
+                    self._spare_values,
+                    self._buffered_values,
+                )
+                if pending is not None:
+                    pending.result()
+            else:
+                self._write(
+                    root,
+                    variables,
+                    self._layer_variables,
+                    self._n_times,
+                    times,
+                    self._buffered_values,
+                    layer_values,
+                )
+                self._n_times += len(times)
+        finally:
+            self._buffered_times.clear()
+
+    def close(self) -> None:
+        """Write any buffered time slices and close the output file."""
+        try:
+            try:
+                self.flush()
+            finally:
+                self._wait_for_pending()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+            if self._root is not None:
+                self._root.close()
+                self._root = None
+            self._plan = None
+
+    def _wait_for_pending(self) -> None:
+        """Wait for a background write, if any, to finish."""
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending.result()
+
+    def _write(
+        self,
+        root: nc.Dataset,
+        variables: dict[str, dict[str, Any]],
+        layer_variables: dict[str, Any],
+        start: int,
+        times: Sequence[float],
+        values: dict[str, dict[str, NDArray]],
+        layer_values: dict[str, NDArray],
+    ) -> None:
+        """Write time slices and layers to the output file."""
+        _write_time_slices(root, variables, times, values, start=start)
+        _write_layer_values(layer_variables, layer_values)
+        if not self._in_memory:
+            root.sync()
+
+    def __del__(self) -> None:
+        """Release the writer's thread and output file.
+
+        Buffered time slices are not written here; call :meth:`close` for
+        that.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+        if self._root is not None:
+            self._root.close()
+
+    def _buffer_time_slice(self) -> None:
+        """Hold the current field values in memory until they're written."""
+        if self._plan is None:
+            self._plan = _make_write_plan(
+                self.grid,
                 names={"node": self.fields},
                 ids={
                     "row": self._rows,
-                    "column": np.arange(self.grid.shape[1] - 2),
+                    "column": self._cols,
                 },
+                with_layers=self._with_layers,
             )
-        self._time += dt
-        self._step_count += 1
+            self._buffered_values = _empty_time_slices(
+                self.grid, self._plan, self._buffer_size
+            )
+            if self._background:
+                self._spare_values = _empty_time_slices(
+                    self.grid, self._plan, self._buffer_size
+                )
+        _copy_time_slice(
+            self.grid,
+            self._plan,
+            out=self._buffered_values,
+            index=len(self._buffered_times),
+        )
+        self._buffered_times.append(self._time)
+        is_full = len(self._buffered_times) == self._buffer_size
+
+        # Layers are written with the last time slice of a buffer, so keep
+        # a copy of them in case the buffer is flushed later, by which time
+        # the grid's layers may have changed.
+        if self._plan.with_layers:
+            self._layer_values = _get_layer_values(
+                self.grid,
+                [*self.grid.event_layers.tracking, "thickness"],
+                ids=self._plan.ids["cell"],
+                copy=self._background or not is_full,
+            )
+
+        if is_full:
+            self.flush()
 
     @property
     def filepath(self) -> str | PathLike[str]:
@@ -92,6 +312,8 @@ class OutputWriter(Component):
 
     @filepath.setter
     def filepath(self, new_val: str | PathLike[str]) -> None:
+        self.close()
+        self._created = False
         if os.path.isfile(new_val) and not self._clobber:
             raise RuntimeError("file exists")
         try:
@@ -109,11 +331,13 @@ class OutputWriter(Component):
 
     @interval.setter
     def interval(self, new_val: int) -> None:
-        if new_val < 0:
+        if not isinstance(new_val, int):
             raise TypeError("interval not an integer")
-        elif not isinstance(new_val, int):
+        elif new_val < 1:
             raise ValueError("non-positive interval")
         self._interval = new_val
+        # Don't wait out a countdown from a longer, previous interval.
+        self._countdown = max(min(self._countdown, new_val - 1), 0)
 
     @property
     def fields(self) -> Iterable[str]:
@@ -122,4 +346,16 @@ class OutputWriter(Component):
 
     @fields.setter
     def fields(self, new_val: Iterable[str]) -> None:
-        self._fields = tuple(new_val)
+        new_val = tuple(new_val)
+        if new_val == self._fields:
+            return
+
+        # Write what's been buffered with the old fields, then start over
+        # with a new plan so that variables for new fields are created.
+        self.flush()
+        self._wait_for_pending()
+        self._fields = new_val
+        self._plan = None
+        self._variables = None
+        self._buffered_values = {}
+        self._spare_values = {}
@@ -1,16 +1,23 @@
 """Plot the layers of a `SequenceModelGrid`."""
 from __future__ import annotations
 
+import pathlib
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 from os import PathLike
 from typing import Any
+from typing import cast
 
 import matplotlib.pyplot as plt
 import numpy as np
 import xarray as xr
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
 from matplotlib.patches import Patch
 from numpy.typing import NDArray
-from scipy.interpolate import interp1d
 
 from sequence.errors import InvalidRowError
 from sequence.errors import MissingRequiredVariable
@@ -35,7 +42,8 @@ def plot_layers(
     x_label: str = "Distance (m)",
     y_label: str = "Elevation (m)",
     legend_location: str = "lower left",
-) -> None:
+    ax: Axes | None = None,
+) -> Axes:
     """Create a plot of sediment layers along a profile.
 
     Parameters
@@ -75,13 +83,24 @@ def plot_layers(
     legend_location : str, optional
         The location of the legend. Valid values are those accepted by the *loc*
         keyword use in :func:`matplotlib.pyplot.legend`.
+    ax : Axes, optional
+        The `matplotlib.axes.Axes` to plot into. If not provided, plot into
+        the current axes and show the plot. If provided, the plot is not shown
+        so that the caller can reuse the axes (for instance, to plot many
+        files into one figure).
 
+    Returns
+    -------
+    Axes
+        The axes that the layers were plotted into.
 
     See Also
     --------
     :func:`plot_file` : Plot a `SequenceModelGrid`'s layers from a file.
     :func:`plot_grid` : Plot a `SequenceModelGrid`'s layers.
     """
+    elevation_at_layer = np.asarray(elevation_at_layer)
+
     if x_of_stack is None:
         x_of_stack = np.arange(elevation_at_layer.shape[1], dtype=float)
 
@@ -96,11 +115,16 @@ def plot_layers(
     plot_shelf = bool(color_shelf)
 
     legend_item = partial(Patch, edgecolor="k", linewidth=0.5)
+    show = ax is None
+    if ax is None:
+        ax = plt.gca()
 
     stack_of_shore = np.searchsorted(x_of_stack, x_of_shore_at_layer)
     stack_of_shelf_edge = np.searchsorted(x_of_stack, x_of_shelf_edge_at_layer)
 
-    water = x_of_stack > x_of_shore_at_layer[-1]
+    water = slice(
+        np.searchsorted(x_of_stack, x_of_shore_at_layer[-1], side="right"), None
+    )
     x_water = x_of_stack[water]
     y_water = elevation_at_layer[-1, water]
 
@@ -108,12 +132,15 @@ def plot_layers(
         layer_stop = len(elevation_at_layer) + layer_stop + 1
     layers_to_plot = _get_layers_to_plot(layer_start, layer_stop, num=n_layers)
 
-    if np.any(water):
+    if len(x_water) > 0:
         if color_water:
-            plt.fill_between(
-                x_water, y_water, np.full_like(x_water, y_water[0]), fc=color_water
+            ax.fill(
+                np.r_[x_water[0], x_water, x_water[-1]],
+                np.r_[y_water[0], y_water, y_water[0]],
+                fc=color_water,
+                edgecolor="none",
             )
-        plt.plot([x_water[0], x_water[-1]], [y_water[0], y_water[0]], color="k")
+        ax.plot([x_water[0], x_water[-1]], [y_water[0], y_water[0]], color="k")
 
     if plot_land:
         _fill_between_layers(
@@ -122,6 +149,7 @@ def plot_layers(
             lower=None,
             upper=stack_of_shore,
             fc=color_land,
+            ax=ax,
         )
 
     if plot_shoreface:
@@ -131,6 +159,7 @@ def plot_layers(
             lower=stack_of_shore,
             upper=stack_of_shelf_edge,
             fc=color_shoreface,
+            ax=ax,
         )
 
     if plot_shelf:
@@ -140,21 +169,28 @@ def plot_layers(
             lower=stack_of_shelf_edge,
             upper=None,
             fc=color_shelf,
+            ax=ax,
         )
 
     if layers_to_plot:
-        plt.plot(
-            x_of_stack,
-            elevation_at_layer[layers_to_plot].T,
-            color=layer_line_color,
-            linewidth=layer_line_width,
+        y_of_lines = np.concatenate(
+            (elevation_at_layer[layers_to_plot], elevation_at_layer[-1:])
+        )
+    else:
+        y_of_lines = elevation_at_layer[-1:]
+    lines = np.empty(y_of_lines.shape + (2,))
+    lines[..., 0] = x_of_stack
+    lines[..., 1] = y_of_lines
+
+    ax.add_collection(
+        LineCollection(
+            list(lines),
+            colors=layer_line_color,
+            linewidths=layer_line_width,
+            zorder=2,
         )
-    plt.plot(
-        x_of_stack,
-        elevation_at_layer[-1],
-        color=layer_line_color,
-        linewidth=layer_line_width,
     )
+    ax.autoscale_view()
 
     if legend_location:
         items = [
@@ -163,18 +199,22 @@ def plot_layers(
             ("Shelf", color_shelf),
         ]
         legend = [legend_item(label=label, fc=color) for label, color in items if color]
-        legend and plt.legend(handles=legend, loc=legend_location)
+        if legend:
+            ax.legend(handles=legend, loc=cast(Any, legend_location))
 
-    plt.xlabel(x_label)
-    plt.ylabel(y_label)
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
     if title:
-        plt.title(title)
-    plt.xlim((x_of_stack[0], x_of_stack[-1]))
+        ax.set_title(title)
+    ax.set_xlim((x_of_stack[0], x_of_stack[-1]))
 
-    plt.show()
+    if show:
+        plt.show()
 
+    return ax
 
-def plot_grid(grid: SequenceModelGrid, row: int | None = None, **kwds: Any) -> None:
+
+def plot_grid(grid: SequenceModelGrid, row: int | None = None, **kwds: Any) -> Axes:
     """Plot a :class:`~SequenceModelGrid`.
 
     Parameters
@@ -186,6 +226,11 @@ def plot_grid(grid: SequenceModelGrid, row: int | None = None, **kwds: Any) -> N
     **kwds: dict, optional
         Additional keyword arguments that are passed along to :func:`~plot_layers`.
 
+    Returns
+    -------
+    Axes
+        The axes that the layers were plotted into.
+
     See Also
     --------
     :func:`plot_layers` : Plot layers from a 2D array of elevations.
@@ -206,16 +251,16 @@ def plot_grid(grid: SequenceModelGrid, row: int | None = None, **kwds: Any) -> N
     time_at_layer_grid = grid.at_layer_grid["age"].flatten()
     time_at_layer = grid.at_layer["age"]
 
-    x_of_shore = interp1d(time_at_layer_grid, x_of_shore[:, row].squeeze())(
-        time_at_layer[:, 0]
+    x_of_shore = np.interp(
+        time_at_layer[:, 0], time_at_layer_grid, x_of_shore[:, row].squeeze()
     )
-    x_of_shelf_edge = interp1d(time_at_layer_grid, x_of_shelf_edge[:, row].squeeze())(
-        time_at_layer[:, 0]
+    x_of_shelf_edge = np.interp(
+        time_at_layer[:, 0], time_at_layer_grid, x_of_shelf_edge[:, row].squeeze()
     )
 
     kwds.setdefault("title", f"time = {time_at_layer[-1, 0]} years")
 
-    plot_layers(
+    return plot_layers(
         elevation_at_layer,
         x_of_stack=x_of_stack,
         x_of_shore_at_layer=x_of_shore,
@@ -224,7 +269,7 @@ def plot_grid(grid: SequenceModelGrid, row: int | None = None, **kwds: Any) -> N
     )
 
 
-def plot_file(filename: str | PathLike, row: int | None = None, **kwds: Any) -> None:
+def plot_file(filename: str | PathLike, row: int | None = None, **kwds: Any) -> Axes:
     """Plot a `SequenceModelGrid` from a *Sequence* output file.
 
     Parameters
@@ -236,6 +281,11 @@ def plot_file(filename: str | PathLike, row: int | None = None, **kwds: Any) ->
     **kwds: dict, optional
         Additional keyword arguments that are passed along to :func:`~plot_layers`.
 
+    Returns
+    -------
+    Axes
+        The axes that the layers were plotted into.
+
     See Also
     --------
     :func:`plot_layers` : Plot layers from a 2D array of elevations.
@@ -252,38 +302,36 @@ def plot_file(filename: str | PathLike, row: int | None = None, **kwds: Any) ->
             raise InvalidRowError(row, ds.dims["row"])
 
         try:
-            thickness_at_layer = ds["at_layer:thickness"][:, row, :]
-            x_of_shore = ds["at_row:x_of_shore"].data
-            x_of_shelf_edge = ds["at_row:x_of_shelf_edge"].data
+            thickness_at_layer = np.ascontiguousarray(
+                ds["at_layer:thickness"][:, row, :].values, dtype=np.float32
+            )
+            x_of_shore = ds["at_row:x_of_shore"][:, row].values
+            x_of_shelf_edge = ds["at_row:x_of_shelf_edge"][:, row].values
             bedrock = (
                 ds["at_node:bedrock_surface__elevation"]
-                .data.reshape((-1, ds.dims["row"] + 2, ds.dims["column"] + 2))
-                .squeeze()
-            )
-            time = ds["time"]
-            time_at_layer = ds["at_layer:age"].data.reshape(
-                (-1, ds.dims["row"], ds.dims["column"])
+                .isel(time=-1)
+                .values.reshape((ds.dims["row"] + 2, ds.dims["column"] + 2))
             )
+            time = ds["time"].values
+            time_at_layer = ds["at_layer:age"][:, row, 0].values
         except KeyError as err:
             raise MissingRequiredVariable(str(err)) from err
 
         try:
-            x_of_stack = (
-                ds["x_of_cell"]
-                .data.reshape((ds.dims["row"], ds.dims["column"]))[row, :]
-                .squeeze()
-            )
+            x_of_stack = ds["x_of_cell"].values.reshape(
+                (ds.dims["row"], ds.dims["column"])
+            )[row]
         except KeyError:
             x_of_stack = np.arange(ds.dims["cell"])
 
-        elevation_at_layer = bedrock[-1, row, 1:-1] + np.cumsum(
-            thickness_at_layer, axis=0
-        )
+        elevation_at_layer = np.empty_like(thickness_at_layer)
+        np.cumsum(thickness_at_layer, axis=0, out=elevation_at_layer)
+        elevation_at_layer += bedrock[row, 1:-1]
 
-    x_of_shore = interp1d(time, x_of_shore[:, row])(time_at_layer[:, row, 0])
-    x_of_shelf_edge = interp1d(time, x_of_shelf_edge[:, row])(time_at_layer[:, row, 0])
+    x_of_shore = np.interp(time_at_layer, time, x_of_shore)
+    x_of_shelf_edge = np.interp(time_at_layer, time, x_of_shelf_edge)
 
-    plot_layers(
+    return plot_layers(
         elevation_at_layer,
         x_of_stack=x_of_stack,
         x_of_shore_at_layer=x_of_shore,
@@ -292,13 +340,77 @@ def plot_file(filename: str | PathLike, row: int | None = None, **kwds: Any) ->
     )
 
 
+def plot_files(
+    filenames: Iterable[str | PathLike],
+    suffix: str = ".png",
+    max_workers: int | None = None,
+    **kwds: Any,
+) -> list[str]:
+    """Plot many *Sequence* output files in parallel and save them as images.
+
+    Each file is plotted in its own process into a new figure that is saved
+    next to the output file, with the same name but with *suffix* as its
+    extension.
+
+    Parameters
+    ----------
+    filenames : iterable of path-like
+        Paths to the files to plot.
+    suffix : str, optional
+        File extension of the images, which determines their format.
+    max_workers : int, optional
+        The maximum number of processes to use. If not provided, use as
+        many as there are processors.
+    **kwds: dict, optional
+        Additional keyword arguments that are passed along to :func:`~plot_file`.
+
+    Returns
+    -------
+    list of str
+        Paths to the saved images.
+
+    See Also
+    --------
+    :func:`plot_file` : Plot a `SequenceModelGrid`'s layers from a file.
+    """
+    filenames = [str(filename) for filename in filenames]
+    images = [str(pathlib.Path(filename).with_suffix(suffix)) for filename in filenames]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(partial(_save_plot_of_file, **kwds), filenames, images))
+
+    return images
+
+
+def _save_plot_of_file(filename: str, image: str, **kwds: Any) -> None:
+    """Plot a file into a new figure, outside of pyplot, and save it."""
+    figure = Figure()
+    plot_file(filename, ax=figure.add_subplot(), **kwds)
+    figure.savefig(image)
+
+
 def _get_layers_to_plot(start: int, stop: int, num: int = -1) -> slice | None:
+    """Select about *num* evenly spaced layers between *start* and *stop*.
+
+    Examples
+    --------
+    >>> from sequence.plot import _get_layers_to_plot
+    >>> _get_layers_to_plot(0, 10, num=5)
+    slice(0, 10, 2)
+    >>> _get_layers_to_plot(0, 10)
+    slice(0, 10, 1)
+    >>> _get_layers_to_plot(4, 2, num=5)
+    slice(4, 2, 1)
+    >>> _get_layers_to_plot(0, 10, num=0) is None
+    True
+    """
     if num == 0:
         return None
-    elif num < 0 or num > stop - start + 1:
-        num = stop - start + 1
-    step = int((stop - start + 1) / num)
-    return slice(start, stop, step)
+
+    n_layers = stop - start + 1
+    if num < 0 or num > n_layers:
+        num = n_layers
+    return slice(start, stop, max(1, n_layers // max(num, 1)))
 
 
 def _fill_between_layers(
@@ -307,6 +419,7 @@ def _fill_between_layers(
     lower: NDArray[np.integer] | None = None,
     upper: NDArray[np.integer] | None = None,
     fc: tuple[float, float, float] | str | None = None,
+    ax: Axes | None = None,
 ) -> None:
     n_layers = len(y)
 
@@ -316,99 +429,208 @@ def _fill_between_layers(
     if upper is None:
         upper = np.full(n_layers, len(x) - 1)
 
-    for layer in range(n_layers - 1):
+    has_width = upper > lower
+    if not np.any(has_width):
+        return
+
+    is_uniform = (lower[:-1] == lower[1:]) & (upper[:-1] == upper[1:])
+
+    verts: list[NDArray] = []
+    for start, stop in np.unique(
+        np.column_stack((lower[:-1], upper[:-1]))[is_uniform], axis=0
+    ):
+        if stop > start:
+            layers = np.flatnonzero(
+                is_uniform & (lower[:-1] == start) & (upper[:-1] == stop)
+            )
+            verts.extend(
+                _outline_layers(x, y[layers], y[layers + 1], start=start, stop=stop)
+            )
+
+    ramps: dict[tuple[int, int], NDArray] = {}
+    for layer in np.flatnonzero(~is_uniform & (has_width[:-1] | has_width[1:])):
         xi, yi = _outline_layer(
             x,
             y[layer],
             y[layer + 1],
             bottom_limits=(lower[layer], upper[layer]),
             top_limits=(lower[layer + 1], upper[layer + 1]),
+            ramps=ramps,
         )
-        plt.fill(xi, yi, fc=fc)
+        verts.append(np.column_stack((xi, yi)))
+
+    if ax is None:
+        ax = plt.gca()
+    ax.add_collection(PolyCollection(verts, facecolors=fc, edgecolors="none"))
+    ax.autoscale_view()
+
+
+def _outline_layers(
+    x: NDArray,
+    y_of_bottom_layers: NDArray,
+    y_of_top_layers: NDArray,
+    start: int,
+    stop: int,
+) -> NDArray:
+    """Outline layers whose tops and bottoms span the same stacks.
+
+    This gives the same outlines as :func:`_outline_layer` with
+    ``bottom_limits == top_limits == (start, stop)`` but for many layers
+    at once.
+
+    Returns
+    -------
+    ndarray of shape (n_layers, n_vertices, 2)
+        The x and y coordinates of each layer's outline.
+    """
+    x_of_outline = np.concatenate((x[stop:start:-1], x[start:stop]))
+    y_of_outline = np.concatenate(
+        (y_of_top_layers[:, stop:start:-1], y_of_bottom_layers[:, start:stop]),
+        axis=1,
+    )
+
+    outlines = np.empty(y_of_outline.shape + (2,))
+    outlines[..., 0] = x_of_outline
+    outlines[..., 1] = y_of_outline
+    return outlines
 
 
 def _outline_layer(
     x: NDArray,
     y_of_bottom_layer: NDArray,
     y_of_top_layer: NDArray,
-    bottom_limits: tuple[float | None, float | None] | None = None,
-    top_limits: tuple[float | None, float | None] | None = None,
+    bottom_limits: tuple[int | None, int | None] | None = None,
+    top_limits: tuple[int | None, int | None] | None = None,
+    ramps: dict[tuple[int, int], NDArray] | None = None,
 ) -> tuple[NDArray, NDArray]:
     if bottom_limits is None:
         bottom_limits = (None, None)
     if top_limits is None:
         top_limits = (None, None)
 
-    bottom_limits = (
+    bottom = (
         bottom_limits[0] if bottom_limits[0] is not None else 0,
         bottom_limits[1] if bottom_limits[1] is not None else len(x) - 1,
     )
-    top_limits = (
+    top = (
         top_limits[0] if top_limits[0] is not None else 0,
         top_limits[1] if top_limits[1] is not None else len(x) - 1,
     )
 
-    is_top = slice(top_limits[1], top_limits[0], -1)
+    is_top = slice(top[1], top[0], -1)
     x_of_top = x[is_top]
     y_of_top = y_of_top_layer[is_top]
 
-    is_bottom = slice(bottom_limits[0], bottom_limits[1])
+    is_bottom = slice(bottom[0], bottom[1])
     x_of_bottom = x[is_bottom]
     y_of_bottom = y_of_bottom_layer[is_bottom]
 
-    if top_limits[0] > bottom_limits[0]:
-        step = -1
-        is_left = slice(bottom_limits[0], top_limits[0] + 1)
+    if top[0] > bottom[0]:
+        is_left = slice(bottom[0], top[0] + 1)
+        y_of_left = _interp_between_layers(
+            x[is_left],
+            y_of_bottom_layer[is_left],
+            y_of_top_layer[is_left],
+            ramp=_ramp(x, bottom[0], top[0], cache=ramps),
+        )[::-1]
+        x_of_left = x[is_left][::-1]
     else:
-        step = 1
-        is_left = slice(top_limits[0], bottom_limits[0] + 1)
-
-    x_of_left = x[is_left]
-    y_of_left = _interp_between_layers(
-        x_of_left[::step],
-        y_of_top_layer[is_left][::step],
-        y_of_bottom_layer[is_left][::step],
-    )
-    x_of_left = x_of_left[::step][:-1]
-    y_of_left = y_of_left[:-1]
-
-    if bottom_limits[1] > top_limits[1]:
-        step = -1
-        is_right = slice(top_limits[1], bottom_limits[1] + 1)
+        is_left = slice(top[0], bottom[0] + 1)
+        y_of_left = _interp_between_layers(
+            x[is_left],
+            y_of_top_layer[is_left],
+            y_of_bottom_layer[is_left],
+            ramp=_ramp(x, top[0], bottom[0], cache=ramps),
+        )
+        x_of_left = x[is_left]
+    x_of_left, y_of_left = x_of_left[:-1], y_of_left[:-1]
+
+    if bottom[1] > top[1]:
+        is_right = slice(top[1], bottom[1] + 1)
+        y_of_right = _interp_between_layers(
+            x[is_right],
+            y_of_top_layer[is_right],
+            y_of_bottom_layer[is_right],
+            ramp=_ramp(x, top[1], bottom[1], cache=ramps),
+        )[::-1]
+        x_of_right = x[is_right][::-1]
     else:
-        step = 1
-        is_right = slice(bottom_limits[1], top_limits[1] + 1)
-    x_of_right = x[is_right]
-    y_of_right = _interp_between_layers(
-        x_of_right[::step],
-        y_of_bottom_layer[is_right][::step],
-        y_of_top_layer[is_right][::step],
-    )
-    x_of_right = x_of_right[::step][:-1]
-    y_of_right = y_of_right[:-1]
+        is_right = slice(bottom[1], top[1] + 1)
+        y_of_right = _interp_between_layers(
+            x[is_right],
+            y_of_bottom_layer[is_right],
+            y_of_top_layer[is_right],
+            ramp=_ramp(x, bottom[1], top[1], cache=ramps),
+        )
+        x_of_right = x[is_right]
+    x_of_right, y_of_right = x_of_right[:-1], y_of_right[:-1]
 
-    return (
-        np.r_[x_of_top, x_of_left, x_of_bottom, x_of_right],
-        np.r_[y_of_top, y_of_left, y_of_bottom, y_of_right],
+    sides = (
+        (x_of_top, x_of_left, x_of_bottom, x_of_right),
+        (y_of_top, y_of_left, y_of_bottom, y_of_right),
     )
+    outline = np.empty((2, sum(len(side) for side in sides[0])))
+    start = 0
+    for x_of_side, y_of_side in zip(*sides):
+        stop = start + len(x_of_side)
+        outline[0, start:stop] = x_of_side
+        outline[1, start:stop] = y_of_side
+        start = stop
+
+    return outline[0], outline[1]
 
 
 def _interp_between_layers(
     x: NDArray[np.floating],
     y_of_bottom: NDArray[np.floating],
     y_of_top: NDArray[np.floating],
-    kind: str = "linear",
+    ramp: NDArray[np.floating] | None = None,
 ) -> NDArray[np.floating]:
-    x = np.asarray(x)
+    """Linearly ramp from the bottom layer, at x[0], to the top layer, at x[-1].
+
+    If provided, *ramp* is the already-calculated normalized distance
+    along *x* (see :func:`_ramp`).
+    """
     y_of_top, y_of_bottom = np.asarray(y_of_top), np.asarray(y_of_bottom)
 
-    assert len(y_of_top) == len(y_of_bottom) == len(x)
+    if ramp is None:
+        x = np.asarray(x)
+        if len(x) == 0:
+            return np.array([], dtype=float)
+        elif len(x) == 1 or x[-1] == x[0]:
+            return y_of_bottom
+        ramp = (x - x[0]) / (x[-1] - x[0])
 
-    if len(x) == 0:
-        return np.array([], dtype=float)
-    elif len(x) == 1:
-        return y_of_bottom
+    return y_of_bottom + (y_of_top - y_of_bottom) * ramp
 
-    dy = (y_of_top - y_of_bottom) * interp1d((x[0], x[-1]), (0.0, 1.0), kind=kind)(x)
 
-    return y_of_bottom + dy
+def _ramp(
+    x: NDArray[np.floating],
+    start: int,
+    stop: int,
+    cache: dict[tuple[int, int], NDArray] | None = None,
+) -> NDArray[np.floating]:
+    """Return the normalized distance along ``x[start : stop + 1]``.
+
+    Adjacent layers mostly pinch out at the same stacks so, if given,
+    ramps are stored in *cache*, keyed by ``(start, stop)``, and reused.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from sequence.plot import _ramp
+    >>> _ramp(np.array([0.0, 1.0, 2.0, 4.0, 8.0]), 1, 3)
+    array([0.        , 0.33333333, 1.        ])
+    """
+    if cache is not None and (start, stop) in cache:
+        return cache[start, stop]
+
+    x = x[start : stop + 1]
+    if stop > start:
+        ramp = (x - x[0]) / (x[-1] - x[0])
+    else:
+        ramp = np.zeros(len(x))
+
+    if cache is not None:
+        cache[start, stop] = ramp
+    return ramp
@@ -10,14 +10,19 @@ from os import PathLike
 
 import numpy as np
 from landlab import Component
+from numpy.typing import ArrayLike
 from numpy.typing import NDArray
 from scipy import interpolate
 
 from sequence.grid import SequenceModelGrid
 
 
-class SeaLevelTimeSeries(Component):
-    """Modify sea level through a time series."""
+class _SeaLevelBase(Component):
+    """Base class for components that set sea level from a curve.
+
+    Subclasses provide the curve as ``_sea_level``, a callable that
+    returns the sea-level elevation at a given time.
+    """
 
     _name = "Sea Level Changer"
 
@@ -44,6 +49,41 @@ class SeaLevelTimeSeries(Component):
         },
     }
 
+    _sea_level: Callable[[float | NDArray], NDArray]
+
+    def __init__(self, grid: SequenceModelGrid, start: float = 0.0):
+        super().__init__(grid)
+        self._time = start
+
+    @property
+    def time(self) -> float:
+        """Return the current component time."""
+        return self._time
+
+    @time.setter
+    def time(self, new_time: float) -> None:
+        self._time = new_time
+
+    def run_one_step(self, dt: float) -> None:
+        """Update the component by a time step.
+
+        Parameters
+        ----------
+        dt : float
+            The time step.
+        """
+        self._time += dt
+        old_sea_level = self.grid.at_grid["sea_level__elevation"]
+        new_sea_level = self._sea_level(self.time)
+        self.grid.at_grid["sea_level__elevation"] = new_sea_level
+        self.grid.at_grid["sea_level__increment_of_elevation"] = (
+            new_sea_level - old_sea_level
+        )
+
+
+class SeaLevelTimeSeries(_SeaLevelBase):
+    """Modify sea level through a time series."""
+
     def __init__(
         self,
         grid: SequenceModelGrid,
@@ -66,7 +106,7 @@ class SeaLevelTimeSeries(Component):
         start : float, optional
             Set the initial time for the component.
         """
-        super().__init__(grid)
+        super().__init__(grid, start=start)
 
         self._filepath = filepath
         self._kind = kind
@@ -74,12 +114,13 @@ class SeaLevelTimeSeries(Component):
         self._sea_level = SeaLevelTimeSeries._sea_level_interpolator(
             np.loadtxt(self._filepath, delimiter=","), kind=self._kind
         )
-        self._time = start
 
     @staticmethod
     def _sea_level_interpolator(
         data: NDArray[np.floating], kind: str = "linear"
     ) -> Callable[[float | NDArray], NDArray]:
+        if kind in ("linear", "cubic"):
+            return _TimeSeriesInterpolator(data[:, 0], data[:, 1], kind=kind)
         return interpolate.interp1d(
             data[:, 0],
             data[:, 1],
@@ -101,33 +142,8 @@ class SeaLevelTimeSeries(Component):
             np.loadtxt(self._filepath, delimiter=","), kind=self._kind
         )
 
-    @property
-    def time(self) -> float:
-        """Return the current component time."""
-        return self._time
-
-    @time.setter
-    def time(self, new_time: float) -> None:
-        self._time = new_time
-
-    def run_one_step(self, dt: float) -> None:
-        """Update the component by a time step.
-
-        Parameters
-        ----------
-        dt : float
-            The time step.
-        """
-        self._time += dt
-        old_sea_level = self.grid.at_grid["sea_level__elevation"]
-        new_sea_level = self._sea_level(self.time)
-        self.grid.at_grid["sea_level__elevation"] = new_sea_level
-        self.grid.at_grid["sea_level__increment_of_elevation"] = (
-            new_sea_level - old_sea_level
-        )
-
 
-class SinusoidalSeaLevel(SeaLevelTimeSeries):
+class SinusoidalSeaLevel(_SeaLevelBase):
     """Adjust a grid's sea level using a sine curve."""
 
     def __init__(
@@ -160,16 +176,72 @@ class SinusoidalSeaLevel(SeaLevelTimeSeries):
             Linear trend of the sea-level curve with time [m / y].
         """
         wave_length /= 2.0 * np.pi
-        super(SeaLevelTimeSeries, self).__init__(grid)
+        super().__init__(grid, start=start)
+
+        def sea_level(time: float | NDArray) -> NDArray:
+            angle = (time - phase) / wave_length
+            sin_of_angle = np.sin(angle)
+            # sin(2 * angle) == 2 * sin(angle) * cos(angle)
+            return (
+                sin_of_angle * (1.0 + 0.6 * np.cos(angle)) * amplitude
+                + mean
+                + linear * time
+            )
 
-        self._sea_level = (
-            lambda time: (
-                np.sin((time - phase) / wave_length)
-                + 0.3 * np.sin((2 * (time - phase)) / wave_length)
+        self._sea_level = sea_level
+
+
+class _TimeSeriesInterpolator:
+    """Interpolate a time series, like *interp1d* but faster.
+
+    Sea level is evaluated at a single time every time step, where the
+    cost of calling an *interp1d* object is much more than that of
+    :func:`numpy.interp` (for *kind="linear"*) or of a
+    :class:`~scipy.interpolate.CubicSpline` (for *kind="cubic"*). As with
+    *interp1d*, times outside of the time series raise a ``ValueError``.
+
+    Examples
+    --------
+    >>> from sequence.sea_level import _TimeSeriesInterpolator
+    >>> sea_level = _TimeSeriesInterpolator([0.0, 10.0], [0.0, -5.0])
+    >>> float(sea_level(2.0))
+    -1.0
+    >>> sea_level(11.0)
+    Traceback (most recent call last):
+    ...
+    ValueError: time is outside of the sea-level time series (0.0, 10.0)
+
+    >>> sea_level = _TimeSeriesInterpolator(
+    ...     [0.0, 1.0, 2.0, 3.0], [0.0, 1.0, 8.0, 27.0], kind="cubic"
+    ... )
+    >>> round(float(sea_level(1.5)), 6)
+    3.375
+    """
+
+    def __init__(self, x: ArrayLike, y: ArrayLike, kind: str = "linear"):
+        self._x = np.array(x, dtype=float)
+        self._y = np.array(y, dtype=float)
+        self._bounds = float(self._x[0]), float(self._x[-1])
+
+        if kind == "linear":
+            self._interpolate = self._interp
+        elif kind == "cubic":
+            self._interpolate = interpolate.CubicSpline(self._x, self._y)
+        else:
+            raise ValueError(f"{kind}: kind must be one of 'linear' or 'cubic'")
+
+    def __call__(self, x: float | NDArray) -> NDArray:
+        lower, upper = self._bounds
+        if np.ndim(x) == 0:
+            out_of_bounds = not lower <= x <= upper
+        else:
+            x = np.asarray(x)
+            out_of_bounds = bool(np.any((x < lower) | (x > upper)))
+        if out_of_bounds:
+            raise ValueError(
+                f"time is outside of the sea-level time series ({lower}, {upper})"
             )
-            * amplitude
-            + mean
-            + linear * time
-        )
+        return self._interpolate(x)
 
-        self._time = start
+    def _interp(self, x: float | NDArray) -> NDArray:
+        return np.interp(x, self._x, self._y)
@@ -306,9 +306,17 @@ class SequenceModel:
 
     def run(self) -> None:
         """Run the model until complete."""
-        with suppress(StopIteration):
-            while 1:
-                self.run_one_step()
+        try:
+            with suppress(StopIteration):
+                while 1:
+                    self.run_one_step()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Write any buffered output and close the output file."""
+        if "output" in self._components:
+            self._components["output"].close()
 
     def advance_components(self, dt: float) -> None:
         """Update each of the components by a time step.
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import gc
+import weakref
+
+import numpy as np
 import pytest
 
 from sequence.grid import SequenceModelGrid
@@ -61,3 +65,53 @@ def test_from_toml(tmpdir):
         actual = SequenceModelGrid.from_toml("grid.toml")
     assert actual.shape == expected.shape
     assert actual.spacing == expected.spacing
+
+
+def test_get_profile_is_view():
+    grid = SequenceModelGrid((3, 5), spacing=(1.0, 10.0))
+    grid.at_node["foo"] = grid.zeros(at="node")
+
+    profile = grid.get_profile("foo")
+    assert profile.shape == (3, 5)
+    assert grid.get_profile("foo") is profile
+
+    profile[:] = 1.0
+    assert all(grid.at_node["foo"].reshape(grid.shape)[1:-1].flat == 1.0)
+
+
+def test_get_profile_with_new_field_values():
+    grid = SequenceModelGrid(5, spacing=10.0)
+    grid.at_node["foo"] = grid.zeros(at="node")
+    profile = grid.get_profile("foo")
+
+    grid.at_node["foo"] = grid.ones(at="node")
+    assert grid.get_profile("foo") is not profile
+    assert all(grid.get_profile("foo").flat == 1.0)
+
+
+
+def test_get_profile_releases_replaced_values():
+    grid = SequenceModelGrid(5, spacing=10.0)
+    grid.at_node["foo"] = grid.zeros(at="node")
+    grid.get_profile("foo")
+    old_values = weakref.ref(grid.at_node["foo"])
+
+    grid.at_node["foo"] = np.ones(2 * grid.number_of_nodes)[::2]
+    grid.get_profile("foo")
+    gc.collect()
+
+    assert old_values() is None
+
+
+def test_coordinates_are_copies():
+    grid = SequenceModelGrid((3, 5), spacing=(100.0, 10.0))
+
+    x_of_column = grid.x_of_column
+    y_of_row = grid.y_of_row
+    assert x_of_column == pytest.approx([0.0, 10.0, 20.0, 30.0, 40.0])
+    assert y_of_row == pytest.approx([0.0, 100.0, 200.0, 300.0, 400.0])
+
+    x_of_column[0] = 1.0
+    y_of_row[0] = 1.0
+    assert grid.x_of_column[0] == pytest.approx(0.0)
+    assert grid.y_of_row[0] == pytest.approx(0.0)
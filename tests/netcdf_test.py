@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import netCDF4 as nc
 import numpy as np
 import pytest
 import xarray as xr
 from pytest import approx
 
 from sequence.grid import SequenceModelGrid
+from sequence.netcdf import _get_layer_values
+from sequence.netcdf import append_netcdf
+from sequence.netcdf import open_netcdf
 from sequence.netcdf import to_netcdf
 
 
@@ -48,6 +52,21 @@ def test_append(tmpdir):
     assert np.all(ds["time"] == approx([0.0, 1.0]))
 
 
+def test_append_to_open_file(tmpdir):
+    grid = SequenceModelGrid(4)
+    grid.at_node["z"] = np.arange(12.0)
+    with tmpdir.as_cwd():
+        root = open_netcdf("test.nc")
+        for time in range(3):
+            append_netcdf(root, grid, time=float(time), names="z", with_layers=False)
+            grid.at_node["z"] *= 10
+        root.close()
+        with xr.open_dataset("test.nc") as ds:
+            assert ds["at_node:z"].shape == (3, 12)
+            assert np.all(ds["time"] == approx([0.0, 1.0, 2.0]))
+            assert np.all(ds["at_node:z"][:, 1] == approx([1.0, 10.0, 100.0]))
+
+
 def test_float_var(tmpdir):
     grid = SequenceModelGrid(4)
     grid.at_node["int_var"] = np.arange(12, dtype=int)
@@ -104,6 +123,20 @@ def test_with_layers(tmpdir):
     assert np.all(ds["at_layer:water_depth"] == np.array([[0.0, 1.0]]))
 
 
+@pytest.mark.parametrize("copy", (True, False))
+def test_layer_values_with_non_contiguous_ids(copy):
+    grid = SequenceModelGrid(6)
+    grid.event_layers.add(np.arange(4.0), age=0.0, water_depth=np.arange(4.0))
+    ids = np.array([3, 3, 2, 2, 1, 1, 0, 0])[::2]
+    assert not ids.flags["C_CONTIGUOUS"]
+
+    values = _get_layer_values(grid, ["thickness", "water_depth"], ids=ids, copy=copy)
+
+    for name in ("thickness", "water_depth"):
+        assert values[name].flags["C_CONTIGUOUS"]
+        assert np.all(values[name] == np.array([[[3.0, 2.0, 1.0, 0.0]]]))
+
+
 def test_formats(tmpdir, format):
     grid = SequenceModelGrid(4)
     grid.at_node["z"] = np.arange(12.0)
@@ -123,3 +156,49 @@ def test_one_location(tmpdir):
         ds = xr.open_dataset("test.nc")
     assert np.all(ds["at_node:var0"] == approx(grid.at_node["var0"][None, :]))
     assert ds["time"] == approx([0.0])
+
+
+def test_chunk_whole_time_slices(tmpdir):
+    grid = SequenceModelGrid(4)
+    grid.at_node["z"] = np.arange(12.0)
+    grid.event_layers.add(10.0, age=0.0)
+    with tmpdir.as_cwd():
+        to_netcdf(grid, "test.nc", ids={"row": [1], "column": [1, 2]}, names="z")
+        with nc.Dataset("test.nc") as root:
+            assert root["at_node:z"].chunking() == [(1 << 16) // (12 * 8), 12]
+            assert root["at_layer:thickness"].chunking() == [(1 << 16) // 16, 1, 2]
+
+
+@pytest.mark.parametrize("zlib", (True, False))
+def test_compression(tmpdir, zlib):
+    grid = SequenceModelGrid(4)
+    grid.at_node["z"] = np.arange(12.0)
+    with tmpdir.as_cwd():
+        to_netcdf(grid, "test.nc", names="z", zlib=zlib, complevel=4)
+        with nc.Dataset("test.nc") as root:
+            filters = root["at_node:z"].filters()
+            assert filters["zlib"] is zlib
+            assert filters["shuffle"] is zlib
+            assert filters["complevel"] == (4 if zlib else 0)
+            assert root["time"].filters()["zlib"] is zlib
+
+
+def test_fletcher32(tmpdir):
+    grid = SequenceModelGrid(4)
+    grid.at_node["z"] = np.arange(12.0)
+    with tmpdir.as_cwd():
+        to_netcdf(grid, "test.nc", names="z", fletcher32=True)
+        with nc.Dataset("test.nc") as root:
+            assert root["at_node:z"].filters()["fletcher32"] is True
+            assert root["time"].filters()["fletcher32"] is True
+
+
+def test_bool_var(tmpdir):
+    grid = SequenceModelGrid(4)
+    grid.at_node["is_wet"] = np.arange(12) % 3 == 0
+    with tmpdir.as_cwd():
+        to_netcdf(grid, "test.nc", with_layers=False)
+        to_netcdf(grid, "test.nc", mode="a", time=1.0, with_layers=False)
+        with nc.Dataset("test.nc") as root:
+            assert root["at_node:is_wet"].dtype == np.int8
+            assert np.all(root["at_node:is_wet"][:] == grid.at_node["is_wet"])
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import os
+
+import netCDF4 as nc
 import numpy as np
+import pytest
 import xarray as xr
 from pytest import approx
 from pytest import raises
@@ -93,3 +97,246 @@ def test_rows_keyword(tmpdir):
         with xr.open_dataset("test.nc") as ds:
             assert np.all(ds.x_of_column == approx([0, 1]))
             assert np.all(ds.y_of_row == approx([2, 1]))
+
+
+def test_buffer_size(tmpdir):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    grid.at_node["z"] = np.zeros(grid.number_of_nodes)
+    with tmpdir.as_cwd():
+        writer = OutputWriter(grid, "test.nc", fields=["z"], buffer_size=3)
+        for _ in range(2):
+            writer.run_one_step()
+            grid.at_node["z"] += 1.0
+        assert not os.path.isfile("test.nc")
+
+        for _ in range(2):
+            writer.run_one_step()
+            grid.at_node["z"] += 1.0
+        with xr.open_dataset("test.nc") as ds:
+            assert np.all(ds["time"] == approx([0.0, 1.0, 2.0]))
+
+        writer.close()
+        with xr.open_dataset("test.nc") as ds:
+            assert np.all(ds["time"] == approx([0.0, 1.0, 2.0, 3.0]))
+            assert np.all(ds["at_node:z"][:, 0] == approx([0.0, 1.0, 2.0, 3.0]))
+
+
+
+@pytest.mark.parametrize("background", (False, True))
+def test_layers_written_with_last_buffered_time(tmpdir, background):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        writer = OutputWriter(grid, "test.nc", buffer_size=3, background=background)
+        for _ in range(2):
+            grid.event_layers.add(1.0)
+            writer.run_one_step()
+        grid.event_layers.add(1.0)
+        grid.event_layers.dz[:] += 10.0
+        writer.close()
+
+        with xr.open_dataset("test.nc") as ds:
+            assert np.all(ds["time"] == approx([0.0, 1.0]))
+            assert ds.sizes["layer"] == 2
+            assert np.all(ds["at_layer:thickness"] == approx(1.0))
+
+
+def test_buffer_with_rows(tmpdir):
+    grid = SequenceModelGrid((3, 4), spacing=(1.0, 1.0))
+    grid.at_row["x_of_shore"] = np.arange(3.0)
+    grid.at_row["x_of_shelf_edge"] = np.zeros(3)
+    with tmpdir.as_cwd():
+        writer = OutputWriter(grid, "test.nc", rows=(1, 3), buffer_size=2)
+        for _ in range(3):
+            writer.run_one_step()
+            grid.at_row["x_of_shore"] += 10.0
+        writer.close()
+
+        with xr.open_dataset("test.nc") as ds:
+            assert np.all(
+                ds["at_row:x_of_shore"]
+                == approx(np.array([[0, 2], [10, 12], [20, 22]]))
+            )
+
+
+def test_in_memory(tmpdir):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        writer = OutputWriter(grid, "test.nc", in_memory=True)
+        for _ in range(3):
+            writer.run_one_step()
+        writer.close()
+
+        with xr.open_dataset("test.nc") as ds:
+            assert np.all(ds["time"] == approx([0.0, 1.0, 2.0]))
+
+
+@pytest.mark.parametrize("format", ("NETCDF4", "NETCDF3_64BIT_OFFSET"))
+def test_without_layers(tmpdir, format):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        writer = OutputWriter(grid, "test.nc", format=format, with_layers=False)
+        for _ in range(2):
+            writer.run_one_step()
+        writer.close()
+
+        with xr.open_dataset("test.nc") as ds:
+            assert "layer" not in ds.dims
+            assert np.all(ds["time"] == approx([0.0, 1.0]))
+
+
+@pytest.mark.parametrize("with_layers", (True, False))
+def test_default_format(tmpdir, with_layers):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        writer = OutputWriter(grid, "test.nc", with_layers=with_layers)
+        writer.run_one_step()
+        writer.close()
+
+        with nc.Dataset("test.nc") as root:
+            assert root.data_model == "NETCDF4"
+
+
+def test_default_format_with_int64_field(tmpdir):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    grid.at_node["n"] = np.arange(grid.number_of_nodes, dtype=np.int64)
+    with tmpdir.as_cwd():
+        writer = OutputWriter(grid, "test.nc", fields=["n"], with_layers=False)
+        writer.run_one_step()
+        writer.close()
+
+        with nc.Dataset("test.nc") as root:
+            assert root.variables["at_node:n"].dtype == np.int64
+
+
+def test_layers_need_netcdf4(tmpdir):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        with raises(ValueError):
+            OutputWriter(grid, "test.nc", format="NETCDF3_64BIT_OFFSET")
+
+
+def test_background(tmpdir):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    grid.at_node["z"] = np.zeros(grid.number_of_nodes)
+    with tmpdir.as_cwd():
+        writer = OutputWriter(
+            grid, "test.nc", fields=["z"], buffer_size=2, background=True
+        )
+        for _ in range(7):
+            writer.run_one_step()
+            grid.at_node["z"] += 1.0
+        writer.close()
+
+        with xr.open_dataset("test.nc") as ds:
+            assert np.all(ds["time"] == approx(np.arange(7.0)))
+            assert np.all(ds["at_node:z"][:, 0] == approx(np.arange(7.0)))
+
+
+@pytest.mark.parametrize("in_memory", (False, True))
+def test_write_after_close(tmpdir, in_memory):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    grid.at_node["z"] = np.zeros(grid.number_of_nodes)
+    with tmpdir.as_cwd():
+        writer = OutputWriter(grid, "test.nc", fields=["z"], in_memory=in_memory)
+        for _ in range(2):
+            writer.run_one_step()
+            grid.at_node["z"] += 1.0
+        writer.close()
+
+        for _ in range(2):
+            writer.run_one_step()
+            grid.at_node["z"] += 1.0
+        writer.close()
+
+        with xr.open_dataset("test.nc") as ds:
+            assert np.all(ds["time"] == approx([0.0, 1.0, 2.0, 3.0]))
+            assert np.all(ds["at_node:z"][:, 0] == approx([0.0, 1.0, 2.0, 3.0]))
+
+
+@pytest.mark.parametrize("background", (False, True))
+def test_change_fields(tmpdir, background):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    grid.at_node["z"] = np.zeros(grid.number_of_nodes)
+    grid.at_node["w"] = np.full(grid.number_of_nodes, 10.0)
+    with tmpdir.as_cwd():
+        writer = OutputWriter(
+            grid, "test.nc", fields=["z"], buffer_size=3, background=background
+        )
+        for _ in range(2):
+            writer.run_one_step()
+            grid.at_node["z"] += 1.0
+
+        writer.fields = ["z", "w"]
+        for _ in range(2):
+            writer.run_one_step()
+            grid.at_node["z"] += 1.0
+            grid.at_node["w"] += 1.0
+        writer.close()
+
+        with xr.open_dataset("test.nc") as ds:
+            assert np.all(ds["time"] == approx([0.0, 1.0, 2.0, 3.0]))
+            assert np.all(ds["at_node:z"][:, 0] == approx([0.0, 1.0, 2.0, 3.0]))
+            assert np.all(ds["at_node:w"][2:, 0] == approx([10.0, 11.0]))
+
+
+def test_failed_write_is_not_retried(tmpdir, monkeypatch):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        writer = OutputWriter(grid, "test.nc", buffer_size=2)
+        writer.run_one_step()
+
+        def _write(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(writer, "_write", _write)
+        with raises(OSError, match="disk full"):
+            writer.flush()
+        writer.close()
+
+
+def test_background_error_raised_on_close(tmpdir, monkeypatch):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        writer = OutputWriter(grid, "test.nc", buffer_size=2, background=True)
+
+        def _write(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(writer, "_write", _write)
+        for _ in range(2):
+            writer.run_one_step()
+        with raises(OSError, match="disk full"):
+            writer.close()
+        assert writer._root is None
+        assert writer._executor is None
+
+        writer.close()
+
+
+def test_shorten_interval(tmpdir):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        writer = OutputWriter(grid, "test.nc", interval=10)
+        writer.run_one_step()
+        writer.interval = 2
+        for _ in range(4):
+            writer.run_one_step()
+        writer.close()
+
+        with xr.open_dataset("test.nc") as ds:
+            assert np.all(ds["time"] == approx([0.0, 2.0, 4.0]))
+
+
+@pytest.mark.parametrize("interval", (0, -1))
+def test_interval_must_be_positive(tmpdir, interval):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        with raises(ValueError):
+            OutputWriter(grid, "test.nc", interval=interval)
+
+
+def test_interval_must_be_an_integer(tmpdir):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        with raises(TypeError):
+            OutputWriter(grid, "test.nc", interval=1.5)
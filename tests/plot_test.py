@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import os
+
+import matplotlib.pyplot as plt
 import numpy as np
 import pytest
+import xarray as xr
+from matplotlib.collections import LineCollection
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
 from numpy.testing import assert_array_almost_equal
 
+from sequence.errors import MissingRequiredVariable
+from sequence.grid import SequenceModelGrid
+from sequence.output_writer import OutputWriter
 from sequence.plot import _interp_between_layers
 from sequence.plot import _outline_layer
+from sequence.plot import _outline_layers
+from sequence.plot import plot_file
+from sequence.plot import plot_files
+from sequence.plot import plot_layers
 
 
 def test_layer_interpolation_bottom_to_top():
@@ -140,3 +154,116 @@ def test_outline_layer_no_limits(bottom_limits, top_limits):
 
     assert_array_almost_equal(x_of_patch, x_expected)
     assert_array_almost_equal(y_of_patch, y_expected)
+
+
+@pytest.mark.parametrize("limits", [(0, 9), (2, 5), (4, 5), (3, 10)])
+def test_outline_layers_matches_outline_layer(limits):
+    x = np.arange(10.0)
+    y = np.cumsum(np.arange(40.0).reshape((4, 10)), axis=0)
+
+    outlines = _outline_layers(x, y[:-1], y[1:], start=limits[0], stop=limits[1])
+
+    assert outlines.shape[0] == 3
+    for layer, outline in enumerate(outlines):
+        x_expected, y_expected = _outline_layer(
+            x, y[layer], y[layer + 1], bottom_limits=limits, top_limits=limits
+        )
+        assert_array_almost_equal(outline[:, 0], x_expected)
+        assert_array_almost_equal(outline[:, 1], y_expected)
+
+
+def test_outline_layer_with_cached_ramps():
+    x = np.arange(10.0) ** 2
+    y = np.cumsum(np.arange(40.0).reshape((4, 10)), axis=0)
+    limits = [(2, 7), (4, 5), (1, 9), (2, 7)]
+
+    ramps = {}
+    for layer in range(3):
+        for _ in range(2):
+            actual = _outline_layer(
+                x,
+                y[layer],
+                y[layer + 1],
+                bottom_limits=limits[layer],
+                top_limits=limits[layer + 1],
+                ramps=ramps,
+            )
+            expected = _outline_layer(
+                x,
+                y[layer],
+                y[layer + 1],
+                bottom_limits=limits[layer],
+                top_limits=limits[layer + 1],
+            )
+            assert_array_almost_equal(actual, expected)
+    assert len(ramps) > 0
+
+
+def _write_output_file(filepath, n_layers=3):
+    grid = SequenceModelGrid(6, spacing=100.0)
+    grid.at_node["bedrock_surface__elevation"] = np.linspace(
+        10.0, -10.0, grid.number_of_nodes
+    )
+    grid.at_row["x_of_shore"] = np.full(grid.shape[0] - 2, 250.0)
+    grid.at_row["x_of_shelf_edge"] = np.full(grid.shape[0] - 2, 350.0)
+
+    writer = OutputWriter(grid, filepath, fields=["bedrock_surface__elevation"])
+    for layer in range(n_layers):
+        grid.event_layers.add(1.0, age=float(layer), water_depth=np.arange(4.0))
+        writer.run_one_step()
+    writer.close()
+
+
+def test_plot_files(tmp_path):
+    filepaths = [tmp_path / "run-0.nc", tmp_path / "run-1.nc"]
+    for filepath in filepaths:
+        _write_output_file(filepath)
+
+    images = plot_files(filepaths, max_workers=2)
+
+    assert images == [str(tmp_path / "run-0.png"), str(tmp_path / "run-1.png")]
+    for image in images:
+        assert os.path.isfile(image)
+        assert os.path.getsize(image) > 0
+
+
+def test_plot_files_raises_worker_errors(tmp_path):
+    _write_output_file(tmp_path / "good.nc")
+    xr.Dataset({"z": ("x", np.zeros(3))}).to_netcdf(tmp_path / "bad.nc")
+
+    with pytest.raises(MissingRequiredVariable):
+        plot_files([tmp_path / "good.nc", tmp_path / "bad.nc"], max_workers=2)
+
+
+def test_plot_layers_into_axes():
+    elevation_at_layer = np.cumsum(np.ones((4, 10)), axis=0) + np.linspace(
+        5.0, -5.0, 10
+    )
+    ax = Figure().add_subplot()
+    figures = plt.get_fignums()
+
+    assert (
+        plot_layers(
+            elevation_at_layer,
+            x_of_shore_at_layer=np.full(4, 3.0),
+            x_of_shelf_edge_at_layer=np.full(4, 6.0),
+            ax=ax,
+        )
+        is ax
+    )
+
+    assert plt.get_fignums() == figures
+    assert any(isinstance(c, PolyCollection) for c in ax.collections)
+    assert any(isinstance(c, LineCollection) for c in ax.collections)
+
+
+def test_plot_file_into_axes(tmp_path):
+    _write_output_file(tmp_path / "run.nc")
+    ax = Figure().add_subplot()
+    figures = plt.get_fignums()
+
+    assert plot_file(tmp_path / "run.nc", ax=ax) is ax
+
+    assert plt.get_fignums() == figures
+    assert len(ax.collections) > 0
+    assert ax.get_title() == str(tmp_path / "run.nc")
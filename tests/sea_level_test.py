@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy import interpolate
+
+from sequence.grid import SequenceModelGrid
+from sequence.sea_level import _TimeSeriesInterpolator
+from sequence.sea_level import SeaLevelTimeSeries
+from sequence.sea_level import SinusoidalSeaLevel
+
+
+def _sinusoid(time, wave_length, amplitude, phase, mean, linear):
+    angle = 2.0 * np.pi * (time - phase) / wave_length
+    return (
+        (np.sin(angle) + 0.3 * np.sin(2.0 * angle)) * amplitude + mean + linear * time
+    )
+
+
+@pytest.mark.parametrize("time", (0.0, 0.25, 1.0, 17.5, 1.0e6 + 0.3))
+def test_sinusoid_matches_closed_form(time):
+    params = {
+        "wave_length": 200.0,
+        "amplitude": 10.0,
+        "phase": 30.0,
+        "mean": -5.0,
+        "linear": 0.01,
+    }
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    sea_level = SinusoidalSeaLevel(grid, **params)
+    sea_level.run_one_step(time)
+
+    np.testing.assert_allclose(
+        grid.at_grid["sea_level__elevation"],
+        _sinusoid(time, **params),
+        rtol=1e-9,
+        atol=1e-9,
+    )
+
+
+def test_sinusoid_with_array_of_times():
+    times = np.linspace(0.0, 5.0e5, 101)
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    sea_level = SinusoidalSeaLevel(grid, wave_length=1000.0, amplitude=2.0)
+
+    np.testing.assert_allclose(
+        sea_level._sea_level(times),
+        _sinusoid(times, 1000.0, 2.0, 0.0, 0.0, 0.0),
+        rtol=1e-9,
+        atol=1e-9,
+    )
+
+
+@pytest.mark.parametrize("kind", ("linear", "cubic"))
+def test_interpolator_matches_interp1d(kind):
+    x = np.linspace(0.0, 100.0, 11)
+    y = np.sin(x / 10.0) * 20.0
+    times = np.linspace(0.0, 100.0, 57)
+
+    actual = _TimeSeriesInterpolator(x, y, kind=kind)
+    expected = interpolate.interp1d(x, y, kind=kind, assume_sorted=True)
+
+    np.testing.assert_allclose(actual(times), expected(times), rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(actual(x), y, rtol=1e-9, atol=1e-9)
+    for time in (0.0, 33.3, 100.0):
+        np.testing.assert_allclose(actual(time), expected(time), rtol=1e-9)
+
+
+@pytest.mark.parametrize("kind", ("linear", "cubic"))
+@pytest.mark.parametrize("time", (-1.0, 100.5, [50.0, 101.0]))
+def test_interpolator_out_of_bounds(kind, time):
+    x = np.linspace(0.0, 100.0, 11)
+    sea_level = _TimeSeriesInterpolator(x, x**2, kind=kind)
+
+    with pytest.raises(ValueError, match="outside of the sea-level time series"):
+        sea_level(time)
+
+
+def test_interpolator_bad_kind():
+    with pytest.raises(ValueError, match="kind must be one of"):
+        _TimeSeriesInterpolator([0.0, 1.0], [0.0, 1.0], kind="quadratic")
+
+
+@pytest.mark.parametrize("kind", ("linear", "cubic", "nearest"))
+def test_time_series(tmpdir, kind):
+    data = np.array([[0.0, 0.0], [10.0, -5.0], [20.0, 5.0], [30.0, 0.0]])
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        np.savetxt("sea_level.csv", data, delimiter=",")
+        sea_level = SeaLevelTimeSeries(grid, "sea_level.csv", kind=kind)
+
+    for time, expected in data[1:]:
+        sea_level.run_one_step(10.0)
+        assert sea_level.time == pytest.approx(time)
+        np.testing.assert_allclose(
+            grid.at_grid["sea_level__elevation"], expected, atol=1e-12
+        )
+
+    with pytest.raises(ValueError):
+        sea_level.run_one_step(10.0)
+
+
+@pytest.mark.parametrize("component", ("sinusoid", "time_series"))
+def test_components_update_sea_level(tmpdir, component):
+    grid = SequenceModelGrid((1, 4), spacing=(1.0, 1.0))
+    with tmpdir.as_cwd():
+        if component == "sinusoid":
+            sea_level = SinusoidalSeaLevel(
+                grid, wave_length=40.0, amplitude=5.0, start=10.0
+            )
+        else:
+            np.savetxt("sea_level.csv", [[0.0, 0.0], [100.0, 50.0]], delimiter=",")
+            sea_level = SeaLevelTimeSeries(grid, "sea_level.csv", start=10.0)
+
+    assert sea_level.time == pytest.approx(10.0)
+
+    elevations = []
+    for time in (15.0, 20.0, 25.0):
+        sea_level.run_one_step(5.0)
+        assert sea_level.time == pytest.approx(time)
+        elevations.append(float(grid.at_grid["sea_level__elevation"]))
+        np.testing.assert_allclose(
+            grid.at_grid["sea_level__elevation"], sea_level._sea_level(time)
+        )
+
+    assert len(set(elevations)) == 3
+    np.testing.assert_allclose(
+        grid.at_grid["sea_level__increment_of_elevation"],
+        elevations[-1] - elevations[-2],
+    )
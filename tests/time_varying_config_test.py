@@ -19,6 +19,27 @@ def test_from_file_basic(datadir, fmt):
     assert config.as_dict() == {"foo": {"bar": "baz"}, "constant": {"pi": 3.14}}
 
 
+def test_from_file_with_subclass_loader(tmpdir):
+    class JsonConfig(TimeVaryingConfig):
+        @staticmethod
+        def load_json(stream):
+            import json
+
+            return [(0, json.load(stream))]
+
+    assert "json" in JsonConfig.get_supported_formats()
+    assert "json" not in TimeVaryingConfig.get_supported_formats()
+
+    with tmpdir.as_cwd():
+        with open("config.json", "w") as fp:
+            fp.write('{"foo": {"bar": "baz"}}')
+        config = JsonConfig.from_file("config.json")
+        with pytest.raises(ValueError):
+            TimeVaryingConfig.from_file("config.json")
+
+    assert config.as_dict() == {"foo": {"bar": "baz"}}
+
+
 @pytest.mark.parametrize("dst_fmt", ("yaml", "toml"))
 @pytest.mark.parametrize("src_fmt", ("yaml", "toml"))
 @pytest.mark.parametrize("basename", ("config", "config-basic"))
@@ -29,3 +50,72 @@ def test_dump(tmpdir, datadir, basename, src_fmt, dst_fmt):
             fp.write(config.dump(fmt=dst_fmt))
         actual = TimeVaryingConfig.from_file(f"config.{dst_fmt}")
         assert actual.as_dict() == config.as_dict()
+
+
+def test_diff():
+    config = TimeVaryingConfig(
+        [0, 1, 2],
+        [
+            {"foo": {"bar": 1, "baz": [1, 2]}, "pi": 3.14},
+            {"foo": {"baz": [1, 3]}},
+            {"foo": {"bar": 2}, "e": 2.72},
+        ],
+    )
+
+    assert config.diff(0, 0) == {}
+    assert config.diff(0, 1) == {("foo", "baz"): (1, 3)}
+    assert config.diff(1, 2) == {("foo", "bar"): 2, ("e",): 2.72}
+    assert config.diff(0, 2) == {
+        ("foo", "bar"): 2,
+        ("foo", "baz"): (1, 3),
+        ("e",): 2.72,
+    }
+
+
+def test_identical_slices_are_shared():
+    config = TimeVaryingConfig(
+        [0, 1, 2, 3],
+        [{"foo": {"bar": 1}}, {"foo": {"bar": 2}}, {"foo": {"bar": 1}}, {"baz": [[1]]}],
+    )
+    assert config._dicts[0] is config._dicts[2]
+    assert config._dicts[0] is not config._dicts[1]
+
+    assert config(2) == {("foo", "bar"): 1}
+    assert config(3) == {("foo", "bar"): 1, ("baz",): ([1],)}
+
+
+@pytest.mark.parametrize(
+    "first,second,expected", ((1, 1.0, 1.0), (1, True, True), ([1], [1.0], (1.0,)))
+)
+def test_equal_values_of_different_types_are_not_shared(first, second, expected):
+    config = TimeVaryingConfig([0, 1], [{"foo": first}, {"foo": second}])
+
+    assert config._dicts[0] is not config._dicts[1]
+
+    value = config(1)[("foo",)]
+    assert value == expected
+    assert type(value) is type(expected)
+    if isinstance(expected, tuple):
+        assert [type(item) for item in value] == [type(item) for item in expected]
+
+
+def test_update():
+    config = TimeVaryingConfig(
+        [0, 2, 3], [{"foo": {"bar": 1}, "pi": 3.14}, {"foo": {"bar": 2}}, {"e": 2.72}]
+    )
+
+    assert config.update(1) == {}
+    assert config.as_dict() == {"foo": {"bar": 1}, "pi": 3.14}
+    assert config.update(1) == {"foo": {"bar": 2}}
+    assert config.as_dict() == {"foo": {"bar": 2}, "pi": 3.14}
+    assert config.update(5) == {"e": 2.72}
+    assert config.as_dict() == {"foo": {"bar": 2}, "pi": 3.14, "e": 2.72}
+    assert config.update(1) == {}
+
+
+def test_already_flat():
+    nested = TimeVaryingConfig([0, 1], [{"foo": {"bar": [1, 2]}}, {"foo": {"bar": 2}}])
+    flat = TimeVaryingConfig([0, 1], [{("foo", "bar"): [1, 2]}, {("foo", "bar"): 2}])
+
+    assert flat._dicts == nested._dicts
+    assert flat.as_dict() == nested.as_dict() == {"foo": {"bar": [1, 2]}}